@@ -2,18 +2,51 @@
 MatrixOS Apps
 
 Each app lives in its own folder with an app.py file containing the implementation.
+
+App classes are imported on first access, so only the apps actually used pay for
+their dependencies (requests, PIL plugins, ...) at startup.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 from .base import AppManifest, BaseApp
 
-# Import apps from their folders
-from .clock import BasicClockApp, BinaryClockApp
-from .dvd import DVDApp
-from .earth import EarthApp
-from .imageviewer import ImageViewerApp
-from .slack import SlackStatusApp
-from .stocks import StocksApp
-from .weather import WeatherApp
+if TYPE_CHECKING:
+    from .clock import BasicClockApp, BinaryClockApp
+    from .dvd import DVDApp
+    from .earth import EarthApp
+    from .imageviewer import ImageViewerApp
+    from .slack import SlackStatusApp
+    from .stocks import StocksApp
+    from .weather import WeatherApp
+
+# App class -> the folder it's imported from
+_APP_MODULES = {
+    "BasicClockApp": ".clock",
+    "BinaryClockApp": ".clock",
+    "DVDApp": ".dvd",
+    "EarthApp": ".earth",
+    "ImageViewerApp": ".imageviewer",
+    "SlackStatusApp": ".slack",
+    "StocksApp": ".stocks",
+    "WeatherApp": ".weather",
+}
+
+
+def __getattr__(name: str):
+    module = _APP_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    app_class = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = app_class  # Later lookups skip __getattr__
+    return app_class
+
+
+def __dir__():
+    return sorted([*globals(), *_APP_MODULES])
+
 
 __all__ = [
     # Base
@@ -46,6 +46,9 @@ class BaseApp(ABC):
         3. update() / render() - Called each frame
         4. on_stop() - Called when app is stopped
 
+    Apps whose content rarely changes can skip frames: update() returning
+    False, or dirty being False, skips that frame's render() and publish.
+
     Example:
         class MyApp(BaseApp):
             @classmethod
@@ -64,6 +67,10 @@ class BaseApp(ABC):
                 return self.fb
     """
 
+    # Whether render() would produce a new frame; override (e.g. as a property) to skip
+    # rendering and publishing while nothing has changed
+    dirty: bool = True
+
     def __init__(
         self,
         app_id: str,
@@ -136,11 +143,12 @@ class BaseApp(ABC):
         """
 
     @abstractmethod
-    def update(self) -> None:
+    def update(self) -> Optional[bool]:
         """
         Update app state.
 
-        Called once per frame before render().
+        Called once per frame before render(). Return False if nothing changed
+        to skip this frame's render().
         Must be implemented by subclasses.
         """
 
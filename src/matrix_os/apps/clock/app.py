@@ -9,11 +9,9 @@ import zoneinfo
 from datetime import datetime
 from typing import Optional
 
-from PIL import Image, ImageDraw
-
 from ...core.display import FrameBuffer
 from ..base import AppManifest, BaseApp
-from ..fonts import get_font
+from ..fonts import GlyphAtlas, get_glyph_atlas
 
 
 class BasicClockApp(BaseApp):
@@ -31,13 +29,14 @@ class BasicClockApp(BaseApp):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.timezone = self.get_env("local_tz", "America/Los_Angeles")
-        self._font = None
+        self._tz = zoneinfo.ZoneInfo(self.timezone)
+        self._glyphs: Optional[GlyphAtlas] = None
         self._blink = True
 
     def on_start(self) -> None:
         """Load font on startup."""
         font_path = self.get_font_path("5x6.bdf")
-        self._font = get_font(font_path)
+        self._glyphs = get_glyph_atlas(font_path)
 
     def update(self) -> None:
         """Toggle blink state."""
@@ -48,45 +47,39 @@ class BasicClockApp(BaseApp):
         self.fb.clear()
 
         # Get current time
-        now = datetime.now(zoneinfo.ZoneInfo(self.timezone))
+        now = datetime.now(self._tz)
         hour = now.strftime("%-I")
         minute = now.strftime("%M")
         ampm = now.strftime("%p")
 
-        # Create image for text rendering
-        img = Image.new("RGB", (self.width, self.height), (0, 0, 0))
-        draw = ImageDraw.Draw(img)
+        # Text goes straight into the framebuffer from pre-rasterized glyphs
+        glyphs = self._glyphs
+        data = self.fb.data
 
         # Build full time string with colon for centering calculation
         full_time = f"{hour}:{minute} {ampm}"
-        bbox = draw.textbbox((0, 0), full_time, font=self._font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
+        text_width = glyphs.text_width(full_time)
+        text_height = glyphs.text_height(full_time)
         base_x = (self.width - text_width) // 2
         y = (self.height - text_height) // 2
 
         # Render components at fixed positions
         # Draw hour
-        draw.text((base_x, y), hour, fill=(255, 255, 255), font=self._font)
+        glyphs.draw(data, (base_x, y), hour, (255, 255, 255))
 
         # Calculate colon position (after hour)
-        hour_bbox = draw.textbbox((0, 0), hour, font=self._font)
-        hour_width = hour_bbox[2] - hour_bbox[0]
-        colon_x = base_x + hour_width
+        colon_x = base_x + glyphs.text_width(hour)
 
         # Draw colon only when blinking on
         if self._blink:
-            draw.text((colon_x, y), ":", fill=(255, 255, 255), font=self._font)
+            glyphs.draw(data, (colon_x, y), ":", (255, 255, 255))
 
         # Calculate minute position (after colon, using colon width for consistent spacing)
-        colon_bbox = draw.textbbox((0, 0), ":", font=self._font)
-        colon_width = colon_bbox[2] - colon_bbox[0]
-        minute_x = colon_x + colon_width
+        minute_x = colon_x + glyphs.text_width(":")
 
         # Draw minute and AM/PM
-        draw.text((minute_x, y), f"{minute} {ampm}", fill=(255, 255, 255), font=self._font)
+        glyphs.draw(data, (minute_x, y), f"{minute} {ampm}", (255, 255, 255))
 
-        self.fb.blit(img)
         return self.fb
 
 
@@ -105,6 +98,7 @@ class BinaryClockApp(BaseApp):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.timezone = self.get_env("local_tz", "America/Los_Angeles")
+        self._tz = zoneinfo.ZoneInfo(self.timezone)
 
     def update(self) -> None:
         """Nothing to update - state is derived from time."""
@@ -119,7 +113,7 @@ class BinaryClockApp(BaseApp):
         """Render the binary clock."""
         self.fb.clear()
 
-        now = datetime.now(zoneinfo.ZoneInfo(self.timezone))
+        now = datetime.now(self._tz)
 
         # Get seconds since midnight (or noon if PM)
         if now.hour < 12:
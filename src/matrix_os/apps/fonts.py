@@ -1,20 +1,26 @@
 """
 Font utilities for MatrixOS apps.
 
-Handles loading BDF fonts for use with PIL.
+Handles loading BDF fonts for use with PIL, and pre-rasterizing them into
+glyph atlases that can be drawn straight into a framebuffer array.
 """
 
 import logging
 import os
 import tempfile
+from typing import Dict, Tuple
 
-from PIL import BdfFontFile, ImageFont
+import numpy as np
+from PIL import BdfFontFile, Image, ImageDraw, ImageFont
 
 log = logging.getLogger(__name__)
 
 # Cache for loaded fonts
 _font_cache = {}
 
+# Cache for glyph atlases, keyed like _font_cache
+_atlas_cache = {}
+
 # Cache directory for converted fonts
 _cache_dir = None
 
@@ -73,3 +79,105 @@ def get_font(font_path: str) -> ImageFont.ImageFont:
         Loaded font object
     """
     return load_bdf_font(font_path)
+
+
+class GlyphAtlas:
+    """
+    Pre-rasterized glyphs for a bitmap font.
+
+    Each glyph is rendered once with PIL into a boolean mask; drawing text
+    is then a NumPy masked assignment per character, with no PIL text layout
+    on the render path. Output matches ImageDraw.text for bitmap fonts,
+    including glyphs that overhang their neighbours.
+    """
+
+    def __init__(self, font: ImageFont.ImageFont, charset: str = ""):
+        self._font = font
+        self._pad = " "  # Blank glyph that rasterized glyphs can overhang into
+        self._glyphs: Dict[str, Tuple[np.ndarray, int, int]] = {}
+        for char in charset:
+            self.glyph(char)
+
+    def glyph(self, char: str) -> Tuple[np.ndarray, int, int]:
+        """
+        Get a character's (mask, x offset, advance), rasterizing it on first use.
+
+        The mask spans the glyph's inked columns, starting at the x offset from
+        the pen position (negative when it overhangs the previous character).
+        """
+        entry = self._glyphs.get(char)
+        if entry is None:
+            font = self._font
+            advance = int(font.getlength(char))
+            height = font.getbbox(char)[3]
+
+            # Rasterize between blank padding at least as wide as the glyph, so
+            # pixels outside its advance aren't clipped away
+            pad_width = max(1, int(font.getlength(self._pad)))
+            pad = self._pad * -(-max(1, advance) // pad_width)
+            origin = int(font.getlength(pad))
+            scratch = Image.new("L", (2 * origin + max(1, advance), max(1, height)), 0)
+            ImageDraw.Draw(scratch).text((0, 0), pad + char + pad, fill=255, font=font)
+            mask = np.asarray(scratch)[:height] > 0
+
+            inked = np.flatnonzero(mask.any(axis=0))
+            if inked.size:
+                lo, hi = inked[0], inked[-1] + 1
+            else:
+                lo = hi = origin
+            entry = self._glyphs[char] = (mask[:, lo:hi], int(lo) - origin, advance)
+        return entry
+
+    def text_width(self, text: str) -> int:
+        """Get the rendered width of text in pixels."""
+        return sum(self.glyph(char)[2] for char in text)
+
+    def text_height(self, text: str) -> int:
+        """Get the rendered height of text in pixels."""
+        return max((self.glyph(char)[0].shape[0] for char in text), default=0)
+
+    def draw(
+        self,
+        target: np.ndarray,
+        xy: Tuple[int, int],
+        text: str,
+        color: Tuple[int, int, int],
+    ) -> None:
+        """Draw text into a (height, width, 3) array, clipping at the edges."""
+        x, y = xy
+        target_h, target_w = target.shape[:2]
+
+        # Like PIL, clip overhangs to the text's own box as well as the target
+        left = max(0, x)
+        right = min(target_w, x + self.text_width(text))
+
+        for char in text:
+            mask, offset, advance = self.glyph(char)
+            h, w = mask.shape
+            glyph_x = x + offset
+
+            # Clip glyph to bounds
+            x0, x1 = max(left, glyph_x), min(right, glyph_x + w)
+            y0, y1 = max(0, y), min(target_h, y + h)
+
+            if x1 > x0 and y1 > y0:
+                region = target[y0:y1, x0:x1]
+                region[mask[y0 - y : y1 - y, x0 - glyph_x : x1 - glyph_x]] = color
+
+            x += advance
+
+
+def get_glyph_atlas(font_path: str) -> GlyphAtlas:
+    """
+    Get a glyph atlas for a BDF font file.
+
+    Args:
+        font_path: Path to BDF font file
+
+    Returns:
+        Shared atlas for the font
+    """
+    atlas = _atlas_cache.get(font_path)
+    if atlas is None:
+        atlas = _atlas_cache[font_path] = GlyphAtlas(load_bdf_font(font_path))
+    return atlas
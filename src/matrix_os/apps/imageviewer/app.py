@@ -7,7 +7,7 @@ Displays a static image on the matrix.
 import os
 from typing import Optional
 
-from PIL import Image
+import numpy as np
 
 from ...core.display import FrameBuffer
 from ..base import AppManifest, BaseApp
@@ -28,12 +28,13 @@ class ImageViewerApp(BaseApp):
     def __init__(self, *args, image_path: str = None, **kwargs):
         super().__init__(*args, **kwargs)
         self._image_path = image_path
-        self._image: Optional[Image.Image] = None
+        self._pixels: Optional[np.ndarray] = None  # Decoded once, blitted without PIL
 
     def on_start(self) -> None:
         """Load the image."""
         if self._image_path and os.path.exists(self._image_path):
-            self._image = self.load_image(self._image_path, (self.width, self.height))
+            image = self.load_image(self._image_path, (self.width, self.height))
+            self._pixels = np.array(image)
 
     def update(self) -> None:
         """Nothing to update for static image."""
@@ -42,7 +43,9 @@ class ImageViewerApp(BaseApp):
         """Render the image."""
         self.fb.clear()
 
-        if self._image:
-            self.fb.blit(self._image)
+        if self._pixels is not None:
+            self.fb.blit_array(self._pixels)
 
+        # Static - nothing to redraw until restarted
+        self.dirty = False
         return self.fb
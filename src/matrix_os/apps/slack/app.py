@@ -57,6 +57,8 @@ class SlackStatusApp(BaseApp):
         self._exclude = [" • Outlook Calendar"]
 
         self._font = None
+        self._img: Optional[Image.Image] = None
+        self._draw: Optional[ImageDraw.ImageDraw] = None
 
     def __getstate__(self):
         """Custom pickle support - exclude unpicklable objects."""
@@ -75,6 +77,10 @@ class SlackStatusApp(BaseApp):
         font_path = self.get_font_path("5x6.bdf")
         self._font = get_font(font_path)
 
+        # Persistent render target, cleared each frame instead of reallocated
+        self._img = Image.new("RGB", (self.width, self.height))
+        self._draw = ImageDraw.Draw(self._img)
+
         self._fetch_status()
 
     def _fetch_status(self) -> None:
@@ -161,8 +167,9 @@ class SlackStatusApp(BaseApp):
         """Render Slack status."""
         self.fb.clear()
 
-        img = Image.new("RGB", (self.width, self.height), (0, 0, 0))
-        draw = ImageDraw.Draw(img)
+        img = self._img
+        draw = self._draw
+        draw.rectangle((0, 0, self.width, self.height), fill=(0, 0, 0))
 
         white = (255, 255, 255)
         grey = (155, 155, 155)
@@ -15,8 +15,9 @@ import logging
 import threading
 import time
 import zoneinfo
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import requests
 from PIL import Image, ImageDraw
@@ -43,6 +44,37 @@ _schedule_lock = threading.Lock()
 # Update interval when market is open (3 minutes, matching original)
 _MARKET_OPEN_UPDATE_INTERVAL = 3 * 60
 
+# Exchange timezone, resolved once at import
+_EASTERN_TZ = zoneinfo.ZoneInfo("America/New_York")
+
+# Trading session length in minutes and graph width in pixels
+_OPEN_MINUTES = 390
+_GRAPH_WIDTH = 64
+
+# Minute offset from market open sampled for each graph column (static, so built once)
+_GRAPH_TIMESTAMPS = tuple(
+    int(round(i * (_OPEN_MINUTES - 1) / (_GRAPH_WIDTH - 1))) for i in range(_GRAPH_WIDTH)
+)
+
+# Max rendered strings whose pixel width is memoized per app
+_WIDTH_CACHE_SIZE = 32
+
+# Prebuilt minute offsets so graph sampling doesn't allocate a timedelta per probe
+_MINUTE_DELTAS = tuple(timedelta(minutes=i) for i in range(_OPEN_MINUTES + 1))
+_ONE_MINUTE = _MINUTE_DELTAS[1]
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    """Immutable stock data published by the fetch thread for rendering."""
+
+    current_price: float
+    close_price: float
+    diff: float
+    percent: float
+    graph_data: Tuple[Tuple[int, int], ...]
+    inflection_pt: int
+
 
 class StocksApp(BaseApp):
     """Stock price and chart display."""
@@ -60,10 +92,12 @@ class StocksApp(BaseApp):
     def _get_cache(cls) -> StockCache:
         """Get or create the shared cache."""
         global _stocks_cache
-        with _stocks_cache_lock:
-            if _stocks_cache is None:
-                _stocks_cache = StockCache()
-            return _stocks_cache
+        # Double-checked: the lock is only taken until the cache exists
+        if _stocks_cache is None:
+            with _stocks_cache_lock:
+                if _stocks_cache is None:
+                    _stocks_cache = StockCache()
+        return _stocks_cache
 
     def __init__(self, *args, symbol: str = "NVDA", **kwargs):
         super().__init__(*args, **kwargs)
@@ -72,51 +106,42 @@ class StocksApp(BaseApp):
         self._api_key = self.get_env("stocks_api_key", "")
         self._timezone = "America/New_York"
         self._exchange = "NYSE"
-        self._open_time = 390  # minutes in stock day
+        self._open_time = _OPEN_MINUTES  # minutes in stock day
 
-        # Data
-        self._current_price: Optional[float] = None
-        self._close_price: Optional[float] = None
-        self._diff: Optional[float] = None
-        self._percent: Optional[float] = None
-        self._graph_data: List[tuple] = []
-        self._inflection_pt: int = 0
+        # Data - replaced wholesale so render never needs a lock
+        self._snapshot: Optional[_Snapshot] = None
 
         # State
         self._is_fetching = False
-        self._data_lock = threading.Lock()
         self._font = None
+        self._img: Optional[Image.Image] = None
+        self._draw: Optional[ImageDraw.ImageDraw] = None
+        self._width_cache: Dict[str, int] = {}
         self._initialized = False
 
-    def __getstate__(self):
-        """Custom pickle support - exclude unpicklable objects."""
-        state = super().__getstate__()
-        if "_data_lock" in state:
-            del state["_data_lock"]
-        return state
-
-    def __setstate__(self, state):
-        """Custom unpickle support - restore locks."""
-        super().__setstate__(state)
-        self._data_lock = threading.Lock()
-
     def on_start(self) -> None:
         """Initialize and load cached data."""
         font_path = self.get_font_path("5x6.bdf")
         self._font = get_font(font_path)
+        self._width_cache.clear()
+
+        # Persistent render target, cleared each frame instead of reallocated
+        self._img = Image.new("RGB", (self.width, self.height))
+        self._draw = ImageDraw.Draw(self._img)
 
         # Load cached data if available
         cache = self._get_cache()
         cached = cache.get(self._symbol)
 
         if cached:
-            with self._data_lock:
-                self._current_price = cached.current_price
-                self._close_price = cached.close_price
-                self._diff = cached.difference
-                self._percent = cached.percent
-                self._graph_data = [tuple(v) for v in cached.graph_values]
-                self._inflection_pt = cached.inflection_pt
+            self._snapshot = _Snapshot(
+                current_price=cached.current_price,
+                close_price=cached.close_price,
+                diff=cached.difference,
+                percent=cached.percent,
+                graph_data=tuple(tuple(v) for v in cached.graph_values),
+                inflection_pt=cached.inflection_pt,
+            )
 
             log.info(
                 "Loaded cached data for %s: $%.2f (from %s)",
@@ -188,8 +213,7 @@ class StocksApp(BaseApp):
 
     def _get_trading_days(self) -> tuple:
         """Get current and previous trading days."""
-        eastern = zoneinfo.ZoneInfo("America/New_York")
-        now = datetime.now(eastern)
+        now = datetime.now(_EASTERN_TZ)
 
         open_hour = 9
         open_min = 30
@@ -329,13 +353,14 @@ class StocksApp(BaseApp):
 
                 trading_day_str = trading_day.strftime("%Y-%m-%d")
 
-                with self._data_lock:
-                    self._current_price = current_price
-                    self._close_price = close_price
-                    self._diff = diff
-                    self._percent = percent
-                    self._graph_data = graph_values
-                    self._inflection_pt = inflection_pt
+                self._snapshot = _Snapshot(
+                    current_price=current_price,
+                    close_price=close_price,
+                    diff=diff,
+                    percent=percent,
+                    graph_data=tuple(graph_values),
+                    inflection_pt=inflection_pt,
+                )
 
                 # Save to cache
                 cache = self._get_cache()
@@ -394,11 +419,6 @@ class StocksApp(BaseApp):
         if not data:
             return {"values": [], "inflection_pt": 0}
 
-        graph_width = 64
-        timestamps = [
-            int(round(i * (self._open_time - 1) / (graph_width - 1))) for i in range(graph_width)
-        ]
-
         if market_open is None:
             try:
                 oldest_dt_str = data[-1]["datetime"]
@@ -410,10 +430,10 @@ class StocksApp(BaseApp):
         data_lookup = {point["datetime"]: point for point in data}
 
         samples = []
-        prev_time = market_open - timedelta(minutes=1)
+        prev_time = market_open - _ONE_MINUTE
 
-        for idx, delta in enumerate(timestamps):
-            target_time = market_open + timedelta(minutes=delta)
+        for idx, delta in enumerate(_GRAPH_TIMESTAMPS):
+            target_time = market_open + _MINUTE_DELTAS[delta]
             sample = None
             tries = 5
 
@@ -422,7 +442,7 @@ class StocksApp(BaseApp):
                 if target_str in data_lookup:
                     sample = data_lookup[target_str]
                 else:
-                    target_time -= timedelta(minutes=1)
+                    target_time -= _ONE_MINUTE
                 tries -= 1
 
             if sample:
@@ -471,13 +491,12 @@ class StocksApp(BaseApp):
 
                 # Parse trading days
                 if _current_trading_day and _previous_trading_day:
-                    eastern = zoneinfo.ZoneInfo("America/New_York")
                     trading_day = datetime.strptime(
                         _current_trading_day + " 09:30:00", "%Y-%m-%d %H:%M:%S"
-                    ).replace(tzinfo=eastern)
+                    ).replace(tzinfo=_EASTERN_TZ)
                     previous_day = datetime.strptime(
                         _previous_trading_day + " 09:30:00", "%Y-%m-%d %H:%M:%S"
-                    ).replace(tzinfo=eastern)
+                    ).replace(tzinfo=_EASTERN_TZ)
 
         # Run market state update in background (outside lock)
         if should_check_market and not self._is_fetching:
@@ -487,92 +506,96 @@ class StocksApp(BaseApp):
             self._fetch_data(trading_day, previous_day)
 
     def _get_text_width(self, draw: ImageDraw, text: str) -> int:
-        """Get text width for right-alignment."""
-        bbox = draw.textbbox((0, 0), text, font=self._font)
-        return bbox[2] - bbox[0]
+        """Get text width for right-alignment (memoized, strings change at most per fetch)."""
+        width = self._width_cache.get(text)
+        if width is None:
+            if len(self._width_cache) >= _WIDTH_CACHE_SIZE:
+                self._width_cache.clear()
+            bbox = draw.textbbox((0, 0), text, font=self._font)
+            width = self._width_cache[text] = bbox[2] - bbox[0]
+        return width
 
     def render(self) -> Optional[FrameBuffer]:
         """Render stock display."""
         self.fb.clear()
 
-        img = Image.new("RGB", (self.width, self.height), (0, 0, 0))
-        draw = ImageDraw.Draw(img)
+        img = self._img
+        draw = self._draw
+        draw.rectangle((0, 0, self.width, self.height), fill=(0, 0, 0))
+
+        snap = self._snapshot
+        white = (255, 255, 255)
+        grey = (155, 155, 155)
+        green = (0, 255, 0)
+        red = (255, 0, 0)
+        green_dim = (0, 25, 0)
+        red_dim = (25, 0, 0)
+
+        line1_y = -1
+        line2_y = 6
 
-        with self._data_lock:
-            white = (255, 255, 255)
-            grey = (155, 155, 155)
-            green = (0, 255, 0)
-            red = (255, 0, 0)
-            green_dim = (0, 25, 0)
-            red_dim = (25, 0, 0)
+        draw.text((1, line1_y), self._symbol, fill=white, font=self._font)
 
-            line1_y = -1
-            line2_y = 6
+        if snap is not None:
+            price_str = "%.2f" % snap.current_price
+            diff_str = "%.2f" % snap.diff
+            pct_str = "%.2f%%" % snap.percent
 
-            draw.text((1, line1_y), self._symbol, fill=white, font=self._font)
+            draw.text((1, line2_y), price_str, fill=grey, font=self._font)
 
-            if self._current_price is not None:
-                price_str = "%.2f" % self._current_price
-                diff_str = "%.2f" % self._diff
-                pct_str = "%.2f%%" % self._percent
+            color = green if snap.diff >= 0 else red
 
-                draw.text((1, line2_y), price_str, fill=grey, font=self._font)
+            diff_width = self._get_text_width(draw, diff_str)
+            draw.text((self.width - diff_width, line1_y), diff_str, fill=color, font=self._font)
 
-                color = green if self._diff >= 0 else red
+            pct_width = self._get_text_width(draw, pct_str)
+            draw.text((self.width - pct_width, line2_y), pct_str, fill=color, font=self._font)
 
-                diff_width = self._get_text_width(draw, diff_str)
-                draw.text((self.width - diff_width, line1_y), diff_str, fill=color, font=self._font)
+            y_offset = 31
 
-                pct_width = self._get_text_width(draw, pct_str)
-                draw.text((self.width - pct_width, line2_y), pct_str, fill=color, font=self._font)
+            # Draw area fills
+            for x, y in snap.graph_data:
+                if y >= snap.inflection_pt:
+                    for fill_y in range(snap.inflection_pt, y + 1):
+                        if 0 <= y_offset - fill_y < self.height:
+                            img.putpixel((x, y_offset - fill_y), green_dim)
+                else:
+                    for fill_y in range(y, snap.inflection_pt + 1):
+                        if 0 <= y_offset - fill_y < self.height:
+                            img.putpixel((x, y_offset - fill_y), red_dim)
+
+            # Draw connected lines
+            num_points = len(snap.graph_data)
+            for idx, (x, y) in enumerate(snap.graph_data):
+                curr_y = y_offset - y
 
-                y_offset = 31
+                if idx < num_points - 1:
+                    next_x, next_y = snap.graph_data[idx + 1]
+                    next_screen_y = y_offset - next_y
 
-                # Draw area fills
-                for x, y in self._graph_data:
-                    if y >= self._inflection_pt:
-                        for fill_y in range(self._inflection_pt, y + 1):
-                            if 0 <= y_offset - fill_y < self.height:
-                                img.putpixel((x, y_offset - fill_y), green_dim)
+                    if y >= snap.inflection_pt:
+                        line_color = green
                     else:
-                        for fill_y in range(y, self._inflection_pt + 1):
-                            if 0 <= y_offset - fill_y < self.height:
-                                img.putpixel((x, y_offset - fill_y), red_dim)
-
-                # Draw connected lines
-                num_points = len(self._graph_data)
-                for idx, (x, y) in enumerate(self._graph_data):
-                    curr_y = y_offset - y
-
-                    if idx < num_points - 1:
-                        next_x, next_y = self._graph_data[idx + 1]
-                        next_screen_y = y_offset - next_y
-
-                        if y >= self._inflection_pt:
-                            line_color = green
-                        else:
-                            line_color = red
-
-                        inflection_screen_y = y_offset - self._inflection_pt
-                        if y >= self._inflection_pt and next_y < self._inflection_pt:
-                            draw.line([(x, curr_y), (x, inflection_screen_y)], fill=green)
-                            draw.line([(x, inflection_screen_y), (next_x, next_screen_y)], fill=red)
-                        elif y < self._inflection_pt and next_y >= self._inflection_pt:
-                            draw.line([(x, curr_y), (x, inflection_screen_y)], fill=red)
-                            draw.line(
-                                [(x, inflection_screen_y), (next_x, next_screen_y)], fill=green
-                            )
-                        else:
-                            draw.line([(x, curr_y), (next_x, next_screen_y)], fill=line_color)
+                        line_color = red
+
+                    inflection_screen_y = y_offset - snap.inflection_pt
+                    if y >= snap.inflection_pt and next_y < snap.inflection_pt:
+                        draw.line([(x, curr_y), (x, inflection_screen_y)], fill=green)
+                        draw.line([(x, inflection_screen_y), (next_x, next_screen_y)], fill=red)
+                    elif y < snap.inflection_pt and next_y >= snap.inflection_pt:
+                        draw.line([(x, curr_y), (x, inflection_screen_y)], fill=red)
+                        draw.line([(x, inflection_screen_y), (next_x, next_screen_y)], fill=green)
                     else:
-                        line_color = green if y >= self._inflection_pt else red
-                        if 0 <= curr_y < self.height:
-                            img.putpixel((x, curr_y), line_color)
-            else:
-                draw.text((1, line2_y), "-.--", fill=grey, font=self._font)
-                draw.text((50, line1_y), "-.--", fill=grey, font=self._font)
-                draw.text((45, line2_y), "-.--%", fill=grey, font=self._font)
-                draw.text((13, 19), "No data", fill=grey, font=self._font)
+                        draw.line([(x, curr_y), (next_x, next_screen_y)], fill=line_color)
+                else:
+                    line_color = green if y >= snap.inflection_pt else red
+                    if 0 <= curr_y < self.height:
+                        img.putpixel((x, curr_y), line_color)
+        else:
+            draw.text((1, line2_y), "-.--", fill=grey, font=self._font)
+            draw.text((50, line1_y), "-.--", fill=grey, font=self._font)
+            draw.text((45, line2_y), "-.--%", fill=grey, font=self._font)
+            draw.text((13, 19), "No data", fill=grey, font=self._font)
 
         self.fb.blit(img)
         return self.fb
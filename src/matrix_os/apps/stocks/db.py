@@ -6,13 +6,44 @@ import json
 import logging
 import sqlite3
 import time
+import zoneinfo
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, tzinfo
 from pathlib import Path
 from typing import List, Optional, Tuple
 
 log = logging.getLogger(__name__)
 
+# Resolved once; falls back to local time if tz data is unavailable
+try:
+    _EASTERN_TZ: Optional[tzinfo] = zoneinfo.ZoneInfo("America/New_York")
+except zoneinfo.ZoneInfoNotFoundError:
+    _EASTERN_TZ = None
+
+# Bump when the schema changes; _init_db migrates older databases
+_SCHEMA_VERSION = 1
+
+_COLUMNS = (
+    "symbol, current_price, close_price, difference, percent, "
+    "inflection_pt, graph_values, trading_day, updated"
+)
+
+# Pure key/value lookups by symbol, so skip the hidden rowid B-tree
+_CREATE_STOCKS_TABLE = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        symbol TEXT NOT NULL,
+        current_price REAL NOT NULL,
+        close_price REAL NOT NULL,
+        difference REAL NOT NULL,
+        percent REAL NOT NULL,
+        inflection_pt INTEGER NOT NULL,
+        graph_values TEXT NOT NULL,
+        trading_day TEXT NOT NULL,
+        updated REAL NOT NULL,
+        PRIMARY KEY (symbol)
+    ) WITHOUT ROWID
+"""
+
 
 def _get_data_dir() -> Path:
     """Get the data directory path, creating it if needed."""
@@ -58,24 +89,28 @@ class StockCache:
         return sqlite3.connect(self.db_path)
 
     def _init_db(self) -> None:
-        """Initialize database schema."""
+        """Initialize database schema, migrating older layouts in place."""
         with self._get_connection() as conn:
-            # Create table if not exists (don't drop - we want to keep data!)
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS stocks (
-                    symbol TEXT PRIMARY KEY,
-                    current_price REAL NOT NULL,
-                    close_price REAL NOT NULL,
-                    difference REAL NOT NULL,
-                    percent REAL NOT NULL,
-                    inflection_pt INTEGER NOT NULL,
-                    graph_values TEXT NOT NULL,
-                    trading_day TEXT NOT NULL,
-                    updated REAL NOT NULL
-                )
-            """
-            )
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= _SCHEMA_VERSION:
+                return
+
+            legacy = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'stocks'"
+            ).fetchone()
+
+            if legacy:
+                # v0 used an implicit rowid table - rebuild it keyed on symbol (keep data!)
+                log.info("Migrating stock cache schema to version %d", _SCHEMA_VERSION)
+                conn.execute("DROP TABLE IF EXISTS stocks_new")
+                conn.execute(_CREATE_STOCKS_TABLE.format(table="stocks_new"))
+                conn.execute(f"INSERT INTO stocks_new ({_COLUMNS}) SELECT {_COLUMNS} FROM stocks")
+                conn.execute("DROP TABLE stocks")
+                conn.execute("ALTER TABLE stocks_new RENAME TO stocks")
+            else:
+                conn.execute(_CREATE_STOCKS_TABLE.format(table="stocks"))
+
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
             conn.commit()
 
     def get(self, symbol: str) -> Optional[StockData]:
@@ -153,14 +188,7 @@ class StockCache:
 
     def _get_trading_day(self) -> str:
         """Get current trading day in YYYY-MM-DD format (US Eastern time)."""
-        try:
-            import zoneinfo
-
-            eastern = zoneinfo.ZoneInfo("America/New_York")
-            now = datetime.now(eastern)
-            return now.strftime("%Y-%m-%d")
-        except Exception:
-            return datetime.now().strftime("%Y-%m-%d")
+        return datetime.now(_EASTERN_TZ).strftime("%Y-%m-%d")
 
     def clear(self, symbol: Optional[str] = None) -> None:
         """Clear cached data for a symbol or all symbols."""
@@ -2,22 +2,47 @@
 Weather App
 
 Displays current weather from OpenWeatherMap API.
+Uses SQLite for caching responses and icons between app restarts.
 """
 
 import io
 import logging
 import threading
 import time
-from typing import Optional
+from dataclasses import dataclass
+from typing import Dict, Optional
 
-from PIL import Image, ImageDraw
+import numpy as np
+import requests
+from PIL import Image
+from requests.adapters import HTTPAdapter
 
 from ...core.display import FrameBuffer
 from ..base import AppManifest, BaseApp
-from ..fonts import get_font
+from ..fonts import GlyphAtlas, get_glyph_atlas
+from .db import WeatherCache
+
+try:
+    from orjson import loads as _json_loads  # C parser, when installed
+except ImportError:
+    from json import loads as _json_loads
 
 log = logging.getLogger(__name__)
 
+# Shared session so refreshes reuse pooled connections instead of reconnecting
+# (one host each for the API and the icons)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=2))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=2))
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    """Immutable weather data published by the fetch thread for rendering."""
+
+    temp: str
+    icon: Optional[np.ndarray] = None  # (h, w, 3) uint8, at most 18x18
+
 
 class WeatherApp(BaseApp):
     """Current weather display."""
@@ -38,41 +63,58 @@ class WeatherApp(BaseApp):
         self._lon = lon or self.get_env("lon", 0.0)
         self._api_key = self.get_env("weather_api_key", "")
 
-        self._temp = "--°F"
-        self._icon: Optional[Image.Image] = None
+        # Data - replaced wholesale so render never needs a lock
+        self._snapshot = _Snapshot(temp="--°F")
+        self._rendered: Optional[_Snapshot] = None  # Snapshot currently in the framebuffer
+        self._icon_cache: Dict[str, np.ndarray] = {}  # icon code -> display-ready pixels
+        self._cache: Optional[WeatherCache] = None
         self._last_update = 0
         self._update_interval = 5 * 60  # 5 minutes
+        self._retry_interval = 30  # After a failed fetch
+        self._stop: Optional[threading.Event] = None  # Created in the app process
 
-        self._font = None
-        self._update_lock = threading.Lock()
-
-    def __getstate__(self):
-        """Custom pickle support - exclude unpicklable objects."""
-        state = super().__getstate__()
-        if "_update_lock" in state:
-            del state["_update_lock"]
-        return state
-
-    def __setstate__(self, state):
-        """Custom unpickle support - restore locks."""
-        super().__setstate__(state)
-        self._update_lock = threading.Lock()
+        self._glyphs: Optional[GlyphAtlas] = None
 
     def on_start(self) -> None:
-        """Initialize and fetch initial weather."""
+        """Initialize and start refreshing weather in the background."""
         font_path = self.get_font_path("5x6.bdf")
-        self._font = get_font(font_path)
+        self._glyphs = get_glyph_atlas(font_path)
 
-        # Start background update
-        self._fetch_weather()
+        self._cache = WeatherCache()
 
-    def _fetch_weather(self) -> None:
-        """Fetch weather data from API in background thread."""
+        # One long-lived refresh thread, rather than one thread per refresh
+        self._stop = threading.Event()
+        threading.Thread(target=self._refresh_loop, name="weather-refresh", daemon=True).start()
+
+    def on_stop(self) -> None:
+        """Stop the refresh thread."""
+        if self._stop:
+            self._stop.set()
 
-        def fetch():
-            try:
-                import requests
+    def _refresh_loop(self) -> None:
+        """Fetch now, then again whenever the data is due, until stopped."""
+        while True:
+            self._fetch_weather()
+
+            # Due one interval after the data was fetched (which may predate us if it
+            # came from the cache); retry sooner if the fetch failed
+            delay = self._last_update + self._update_interval - time.time()
+            if delay <= 0:
+                delay = self._retry_interval
+
+            if self._stop.wait(delay):
+                return
 
+    def _fetch_weather(self) -> None:
+        """Fetch weather data (on the refresh thread) and publish a new snapshot."""
+        try:
+            # Serve from the on-disk cache while the last response is fresh
+            cache_key = f"{self._lat},{self._lon}"
+            cached = self._cache.get_response(cache_key, max_age=self._update_interval)
+
+            if cached:
+                data, updated = cached
+            else:
                 url = (
                     f"https://api.openweathermap.org/data/3.0/onecall"
                     f"?lat={self._lat}&lon={self._lon}"
@@ -80,62 +122,76 @@ class WeatherApp(BaseApp):
                     f"&appid={self._api_key}"
                 )
 
-                response = requests.get(url, timeout=7)
-                data = response.json()
+                response = _SESSION.get(url, timeout=7)
+                data = _json_loads(response.content)
+                updated = time.time()
 
                 if "current" in data:
-                    current = data["current"]
+                    self._cache.set_response(cache_key, data)
+
+            if "current" in data:
+                current = data["current"]
 
-                    # Fetch icon outside lock
-                    icon_code = current["weather"][0]["icon"]
-                    icon_url = f"http://openweathermap.org/img/wn/{icon_code}@2x.png"
-                    icon_response = requests.get(icon_url, timeout=7)
+                # Decode each icon code only once
+                icon_code = current["weather"][0]["icon"]
+                icon = self._icon_cache.get(icon_code)
+                if icon is None:
+                    png = self._cache.get_icon(icon_code)
+                    fetched = png is None
+                    if fetched:
+                        icon_url = f"http://openweathermap.org/img/wn/{icon_code}@2x.png"
+                        png = _SESSION.get(icon_url, timeout=7).content
 
-                    icon_img = Image.open(io.BytesIO(icon_response.content))
-                    icon_img.thumbnail((18, 18))
-                    icon = icon_img.convert("RGB")
+                    # Icons are square, so a direct bilinear resize matches thumbnail()
+                    # without its aspect math and slower default filter. Keep the
+                    # decoded pixels so render can blit them without PIL.
+                    icon_img = Image.open(io.BytesIO(png)).convert("RGB")
+                    icon_img = icon_img.resize((18, 18), Image.Resampling.BILINEAR)
+                    icon = np.array(icon_img)
+                    self._icon_cache[icon_code] = icon
 
-                    temp = f"{round(current['temp'])}°F"
+                    # Only persist icons that decoded successfully
+                    if fetched:
+                        self._cache.set_icon(icon_code, png)
 
-                    # Only hold lock briefly
-                    with self._update_lock:
-                        self._temp = temp
-                        self._icon = icon
-                        self._last_update = time.time()
+                temp = f"{round(current['temp'])}°F"
 
-                    log.info(f"Weather updated: {temp}")
+                # Publish with a single reference store
+                self._snapshot = _Snapshot(temp=temp, icon=icon)
+                self._last_update = updated
 
-            except Exception as e:
-                log.warning(f"Weather fetch failed: {e}")
+                log.info(f"Weather updated: {temp}")
 
-        thread = threading.Thread(target=fetch, daemon=True)
-        thread.start()
+        except Exception as e:
+            log.warning(f"Weather fetch failed: {e}")
 
     def update(self) -> None:
-        """Check if we need to refresh weather data."""
-        if time.time() - self._last_update > self._update_interval:
-            self._fetch_weather()
+        """Nothing to do - the refresh thread publishes new data."""
+
+    @property
+    def dirty(self) -> bool:
+        """Only redraw once the fetch thread has published new data."""
+        return self._snapshot is not self._rendered
 
     def render(self) -> Optional[FrameBuffer]:
         """Render the weather display."""
-        self.fb.clear()
+        # Content only changes on refresh; until then the framebuffer already holds the frame
+        snapshot = self._snapshot
+        if snapshot is self._rendered:
+            return self.fb
 
-        # Create image for rendering
-        img = Image.new("RGB", (self.width, self.height), (0, 0, 0))
-        draw = ImageDraw.Draw(img)
+        self.fb.clear()
 
-        with self._update_lock:
-            # Draw icon
-            if self._icon:
-                icon_x = (self.width - 18) // 2
-                img.paste(self._icon, (icon_x, 2))
+        # Draw icon
+        if snapshot.icon is not None:
+            icon_x = (self.width - 18) // 2
+            self.fb.blit_array(snapshot.icon, icon_x, 2)
 
-            # Draw temperature
-            if self._font:
-                bbox = draw.textbbox((0, 0), self._temp, font=self._font)
-                text_width = bbox[2] - bbox[0]
-                x = (self.width - text_width) // 2
-                draw.text((x, 22), self._temp, fill=(255, 255, 255), font=self._font)
+        # Draw temperature straight into the framebuffer from pre-rasterized glyphs
+        if self._glyphs:
+            text_width = self._glyphs.text_width(snapshot.temp)
+            x = (self.width - text_width) // 2
+            self._glyphs.draw(self.fb.data, (x, 22), snapshot.temp, (255, 255, 255))
 
-        self.fb.blit(img)
+        self._rendered = snapshot
         return self.fb
@@ -0,0 +1,118 @@
+"""
+Weather data cache using SQLite.
+
+Keeps the last OneCall response per location (short-lived) and the raw
+icon PNGs per icon code (effectively permanent) so restarts and repeated
+icon codes don't hit the network.
+"""
+
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+
+def _get_data_dir() -> Path:
+    """Get the data directory path, creating it if needed."""
+    # Find project root (where data/ should be)
+    # Go up from: src/matrix_os/apps/weather/db.py -> project root
+    current = Path(__file__).resolve()
+    project_root = current.parent.parent.parent.parent.parent
+
+    data_dir = project_root / "data"
+    data_dir.mkdir(exist_ok=True)
+    return data_dir
+
+
+def get_db_path() -> str:
+    """Get the path to the weather database."""
+    return str(_get_data_dir() / "weather.db")
+
+
+class WeatherCache:
+    """SQLite-based cache for weather responses and icons."""
+
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or get_db_path()
+        self._init_db()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get a database connection."""
+        return sqlite3.connect(self.db_path)
+
+    def _init_db(self) -> None:
+        """Initialize database schema."""
+        with self._get_connection() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT NOT NULL,
+                    body TEXT NOT NULL,
+                    updated REAL NOT NULL,
+                    PRIMARY KEY (key)
+                ) WITHOUT ROWID
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS icons (
+                    code TEXT NOT NULL,
+                    png BLOB NOT NULL,
+                    PRIMARY KEY (code)
+                ) WITHOUT ROWID
+                """
+            )
+            conn.commit()
+
+    def get_response(self, key: str, max_age: float) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Get a cached response and its timestamp if younger than max_age seconds."""
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute(
+                    "SELECT body, updated FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+
+            if row is None or time.time() - row[1] > max_age:
+                return None
+            return json.loads(row[0]), row[1]
+        except Exception as e:
+            log.warning("Failed to get cached weather response: %s", e)
+            return None
+
+    def set_response(self, key: str, data: Dict[str, Any]) -> None:
+        """Cache a response."""
+        try:
+            with self._get_connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, body, updated) VALUES (?, ?, ?)",
+                    (key, json.dumps(data), time.time()),
+                )
+                conn.commit()
+        except Exception as e:
+            log.warning("Failed to cache weather response: %s", e)
+
+    def get_icon(self, code: str) -> Optional[bytes]:
+        """Get the cached PNG bytes for an icon code."""
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute("SELECT png FROM icons WHERE code = ?", (code,)).fetchone()
+            return row[0] if row else None
+        except Exception as e:
+            log.warning("Failed to get cached weather icon: %s", e)
+            return None
+
+    def set_icon(self, code: str, png: bytes) -> None:
+        """Cache the PNG bytes for an icon code."""
+        try:
+            with self._get_connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO icons (code, png) VALUES (?, ?)",
+                    (code, png),
+                )
+                conn.commit()
+        except Exception as e:
+            log.warning("Failed to cache weather icon: %s", e)
@@ -2,8 +2,9 @@
 System configuration for MatrixOS.
 """
 
+import functools
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import List, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -26,6 +27,15 @@ class EnvSettings(BaseSettings):
     lon: float = 0.0
 
 
+@functools.lru_cache(maxsize=1)
+def _load_env() -> EnvSettings:
+    """Load .env settings once per process; every SystemConfig shares the result."""
+    try:
+        return EnvSettings()
+    except Exception:
+        return EnvSettings.model_construct()
+
+
 @dataclass
 class DisplayConfig:
     """Hardware display configuration."""
@@ -57,6 +67,11 @@ class SchedulerConfig:
     transition_duration: float = 0.5  # seconds
     max_framerate: int = 60
     min_framerate: int = 1
+    # CPU pinning (Linux only) - keeps the render loop's working set in one core's cache
+    render_cpu: Optional[int] = None  # CPU for the kernel render thread (None = unpinned)
+    app_cpus: List[int] = field(default_factory=list)  # CPUs for app processes, round-robin
+    # Run the render thread as SCHED_FIFO (needs root or CAP_SYS_NICE), else at nice -5
+    realtime: bool = False
 
 
 @dataclass
@@ -69,7 +84,4 @@ class SystemConfig:
 
     def __post_init__(self):
         if self.env is None:
-            try:
-                self.env = EnvSettings()
-            except Exception:
-                self.env = EnvSettings.model_construct()
+            self.env = _load_env()
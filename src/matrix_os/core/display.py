@@ -5,9 +5,11 @@ Provides a hardware-agnostic interface for rendering to the LED matrix.
 """
 
 import logging
+import queue
 import sys
+import threading
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 import numpy as np
 from PIL import Image
@@ -44,7 +46,12 @@ class FrameBuffer:
 
     def clear(self, color: Tuple[int, int, int] = (0, 0, 0)) -> None:
         """Clear the framebuffer to a solid color."""
-        self._data[:, :] = color
+        r, g, b = color
+        if r == g == b:
+            # Gray (incl. black, the common case): a flat memset, no per-pixel broadcast
+            self._data.fill(r)
+        else:
+            self._data[:, :] = color
 
     def set_pixel(self, x: int, y: int, r: int, g: int, b: int) -> None:
         """Set a single pixel."""
@@ -58,51 +65,41 @@ class FrameBuffer:
         return (0, 0, 0)
 
     def draw_line(self, x0: int, y0: int, x1: int, y1: int, r: int, g: int, b: int) -> None:
-        """Draw a line using Bresenham's algorithm."""
-        dx = abs(x1 - x0)
-        dy = abs(y1 - y0)
-        sx = 1 if x0 < x1 else -1
-        sy = 1 if y0 < y1 else -1
-        err = dx - dy
+        """Draw a line, rasterized as one vectorized write."""
+        # One point per step along the major axis, minor axis rounded (DDA)
+        n = max(abs(x1 - x0), abs(y1 - y0)) + 1
+        xs = np.rint(np.linspace(x0, x1, n)).astype(np.intp)
+        ys = np.rint(np.linspace(y0, y1, n)).astype(np.intp)
 
-        while True:
-            self.set_pixel(x0, y0, r, g, b)
-            if x0 == x1 and y0 == y1:
-                break
-            e2 = 2 * err
-            if e2 > -dy:
-                err -= dy
-                x0 += sx
-            if e2 < dx:
-                err += dx
-                y0 += sy
+        # Clip to framebuffer bounds
+        mask = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        self._data[ys[mask], xs[mask]] = (r, g, b)
 
     def blit(self, image: Image.Image, x: int = 0, y: int = 0) -> None:
         """Blit a PIL Image onto the framebuffer."""
         if image.mode != "RGB":
             image = image.convert("RGB")
 
-        img_array = np.array(image)
-        h, w = img_array.shape[:2]
+        # asarray wraps the image bytes without the extra copy np.array makes
+        self.blit_array(np.asarray(image), x, y)
 
-        # Calculate clipping bounds
-        src_x, src_y = 0, 0
-        dst_x, dst_y = x, y
+    def blit_array(self, pixels: np.ndarray, x: int = 0, y: int = 0) -> None:
+        """Blit a (height, width, 3) uint8 array onto the framebuffer."""
+        h, w = pixels.shape[:2]
 
-        if dst_x < 0:
-            src_x = -dst_x
-            w += dst_x
-            dst_x = 0
-        if dst_y < 0:
-            src_y = -dst_y
-            h += dst_y
-            dst_y = 0
+        # Full-frame fast path (apps that render a whole screen image)
+        if x == 0 and y == 0 and w == self.width and h == self.height:
+            np.copyto(self._data, pixels)
+            return
 
-        w = min(w, self.width - dst_x)
-        h = min(h, self.height - dst_y)
+        # Calculate clipping bounds
+        src_x, src_y = max(0, -x), max(0, -y)
+        dst_x, dst_y = max(0, x), max(0, y)
+        w = min(w - src_x, self.width - dst_x)
+        h = min(h - src_y, self.height - dst_y)
 
         if w > 0 and h > 0:
-            self._data[dst_y : dst_y + h, dst_x : dst_x + w] = img_array[
+            self._data[dst_y : dst_y + h, dst_x : dst_x + w] = pixels[
                 src_y : src_y + h, src_x : src_x + w
             ]
 
@@ -112,9 +109,45 @@ class FrameBuffer:
 
     def copy(self) -> "FrameBuffer":
         """Create a copy of this framebuffer."""
-        fb = FrameBuffer(self.width, self.height)
-        fb._data = self._data.copy()
-        return fb
+        return FrameBuffer(self.width, self.height, self._data.copy())
+
+    def copy_into(self, dst: "FrameBuffer") -> None:
+        """Copy this framebuffer's pixels into an existing same-sized framebuffer."""
+        np.copyto(dst._data, self._data)
+
+
+class FrameBufferPool:
+    """
+    Recycles display-sized framebuffers.
+
+    Framebuffers are handed out on app registration (and for the kernel's
+    per-app receive buffers) and returned on unregistration, so app churn
+    reuses buffers instead of allocating new arrays.
+    """
+
+    def __init__(self, width: int, height: int, size: int = 8):
+        self.width = width
+        self.height = height
+        self._size = size
+        self._free: List[FrameBuffer] = [FrameBuffer(width, height) for _ in range(size)]
+        self._lock = threading.Lock()
+
+    def acquire(self) -> FrameBuffer:
+        """Get a cleared framebuffer, allocating only if the pool is empty."""
+        with self._lock:
+            if self._free:
+                return self._free.pop()
+        return FrameBuffer(self.width, self.height)
+
+    def release(self, framebuffer: FrameBuffer) -> None:
+        """Return a framebuffer to the pool. The caller must not use it afterwards."""
+        if framebuffer.width != self.width or framebuffer.height != self.height:
+            return
+
+        framebuffer.clear()
+        with self._lock:
+            if len(self._free) < self._size:
+                self._free.append(framebuffer)
 
 
 class Display:
@@ -129,6 +162,17 @@ class Display:
         self._matrix: Optional["RGBMatrix"] = None
         self._canvas = None
         self._initialized = False
+        self.pool = FrameBufferPool(self.width, self.height)
+
+        # Two staging images: the kernel fills one while the swap thread pushes the other
+        self._images: Tuple[Image.Image, ...] = ()
+        self._back = 0
+        self._swap_queue: "queue.Queue[Optional[Image.Image]]" = queue.Queue(maxsize=1)
+        self._swap_thread: Optional[threading.Thread] = None
+
+        # Copy of the last frame pushed to the matrix, for skipping unchanged frames
+        self._last_frame: Optional[np.ndarray] = None
+        self._last_frame_valid = False
 
     @property
     def width(self) -> int:
@@ -169,6 +213,14 @@ class Display:
 
             self._matrix = RGBMatrix(options=options)
             self._canvas = self._matrix.CreateFrameCanvas()
+            self._images = tuple(Image.new("RGB", (self.width, self.height)) for _ in range(2))
+            self._last_frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+            self._swap_thread = threading.Thread(
+                target=self._swap_loop,
+                name="matrixos-display",
+                daemon=True,
+            )
+            self._swap_thread.start()
             self._initialized = True
             log.info(f"Display initialized: {self.width}x{self.height}")
             return True
@@ -190,10 +242,37 @@ class Display:
             # Simulation mode - just log
             return
 
-        # Convert framebuffer to PIL Image and set on canvas
-        image = framebuffer.to_image()
-        self._canvas.SetImage(image)
-        self._canvas = self._matrix.SwapOnVSync(self._canvas)
+        # Nothing changed since the last frame pushed - skip the copy and the swap
+        if self._last_frame_valid and np.array_equal(framebuffer.data, self._last_frame):
+            return
+
+        # Swap thread still busy with the previous frame - drop this one rather than block.
+        # The queue holds at most one image, so the back image is never in use here.
+        if self._swap_queue.full():
+            return
+
+        # Load pixels into the back staging image (no per-frame Image allocation)
+        image = self._images[self._back]
+        image.frombytes(framebuffer.data)
+        self._back ^= 1
+        self._swap_queue.put_nowait(image)
+
+        np.copyto(self._last_frame, framebuffer.data)
+        self._last_frame_valid = True
+
+    def _swap_loop(self) -> None:
+        """Push staged frames to the matrix, waiting on vsync off the render thread."""
+        while True:
+            image = self._swap_queue.get()
+            if image is None:
+                break
+
+            try:
+                # The binding has no raw-buffer setter, so SetImage still needs a PIL Image
+                self._canvas.SetImage(image)
+                self._canvas = self._matrix.SwapOnVSync(self._canvas)
+            except Exception as e:
+                log.error(f"Display swap failed: {e}")
 
     def set_brightness(self, brightness: int) -> None:
         """Set display brightness (0-100)."""
@@ -202,10 +281,14 @@ class Display:
             self._matrix.brightness = brightness
         self.config.brightness = brightness
 
+        # Brightness is applied when pixels are set, so the next frame must be pushed
+        self._last_frame_valid = False
+
     def clear(self) -> None:
         """Clear the display."""
         if self._matrix:
             self._matrix.Clear()
+        self._last_frame_valid = False
 
     def create_framebuffer(self) -> FrameBuffer:
         """Create a new framebuffer sized for this display."""
@@ -213,6 +296,16 @@ class Display:
 
     def shutdown(self) -> None:
         """Shutdown the display."""
+        if self._swap_thread and self._swap_thread.is_alive():
+            # Discard any pending frame so the sentinel fits in the queue
+            try:
+                self._swap_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._swap_queue.put(None)
+            self._swap_thread.join(timeout=2.0)
+        self._swap_thread = None
+
         self.clear()
         self._initialized = False
         log.info("Display shutdown complete")
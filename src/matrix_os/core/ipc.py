@@ -6,18 +6,23 @@ Provides thread-safe and process-safe communication between apps and the kernel.
 
 import logging
 import multiprocessing
+import os
 import threading
-from dataclasses import dataclass, field
-from enum import Enum, auto
+import time
+from dataclasses import dataclass
+from enum import IntEnum, auto
 from multiprocessing import Queue as MPQueue
+from multiprocessing import shared_memory
 from queue import Empty, Queue
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
 
 log = logging.getLogger(__name__)
 
 
-class MessageType(Enum):
-    """Types of IPC messages."""
+class MessageType(IntEnum):
+    """Types of IPC messages (ints, so comparisons and dict lookups are cheap)."""
 
     # Frame submission
     FRAME_READY = auto()
@@ -46,20 +51,133 @@ class MessageType(Enum):
     RESPONSE_DENIED = auto()
 
 
-@dataclass
 class Message:
-    """IPC message container."""
-
-    type: MessageType
-    source: str  # App ID or "kernel"
-    target: str = "kernel"  # App ID or "kernel"
-    payload: Any = None
-    timestamp: float = field(default_factory=lambda: __import__("time").time())
+    """IPC message container (slotted - no per-instance __dict__)."""
+
+    __slots__ = ("type", "source", "target", "payload", "timestamp")
+
+    def __init__(
+        self,
+        type: MessageType,
+        source: str,  # App ID or "kernel"
+        target: str = "kernel",  # App ID or "kernel"
+        payload: Any = None,
+        timestamp: Optional[float] = None,
+    ):
+        self.type = type
+        self.source = source
+        self.target = target
+        self.payload = payload
+        self.timestamp = time.time() if timestamp is None else timestamp
 
     def __repr__(self) -> str:
         return f"Message({self.type.name}, {self.source} -> {self.target})"
 
 
+# Slot header: two uint32 words (each a single aligned store even on 32-bit ARM),
+# which also keeps the frames that follow 8-byte aligned
+_FRAME_SLOT_HEADER = 8
+_PUBLISHED = 0  # Generation of the newest complete frame
+_WRITING = 1  # Generation the app started writing most recently
+_GENERATION_MASK = 0xFFFFFFFF
+
+
+class FrameSlot:
+    """
+    Shared-memory frame transport between an app process and the kernel.
+
+    A single-producer/single-consumer mailbox: the app writes frames into two
+    alternating buffers and then bumps a generation counter in the header;
+    the kernel polls the counter and copies out the newest frame. No queue,
+    pickling or pipe write is involved on the frame path. Pickles by name, so
+    it can be passed to the app process like a queue.
+
+    Like a seqlock, the app also records which generation it is writing, so
+    the kernel can detect the rare case where the app lapped it and started
+    overwriting the buffer mid-copy, and discard that torn frame. Frames are
+    copied out through a scratch buffer, so a torn one never reaches the caller.
+    """
+
+    def __init__(self, width: int, height: int, name: Optional[str] = None):
+        self.width = width
+        self.height = height
+        # Only the creating process unlinks (a forked child inherits this object as-is)
+        self._owner_pid = os.getpid() if name is None else None
+        self._shm = shared_memory.SharedMemory(
+            name=name, create=name is None, size=_FRAME_SLOT_HEADER + 2 * width * height * 3
+        )
+        self._header = np.ndarray((2,), dtype=np.uint32, buffer=self._shm.buf)
+        # One prebuilt (height, width, 3) view per buffer, so the frame path never
+        # constructs array objects
+        frame_size = width * height * 3
+        self._buffers = tuple(
+            np.ndarray(
+                (height, width, 3),
+                dtype=np.uint8,
+                buffer=self._shm.buf,
+                offset=_FRAME_SLOT_HEADER + i * frame_size,
+            )
+            for i in range(2)
+        )
+        # Torn-frame landing area, so read_into only touches out once a copy is verified
+        self._scratch = np.empty((height, width, 3), dtype=np.uint8)
+        # Last generation written (app side). Continue from what's already published,
+        # so a restarted app's first frame isn't mistaken for one already consumed.
+        self._generation = int(self._header[_PUBLISHED])
+        self._consumed = 0  # Last generation copied out (kernel side)
+
+    def __getstate__(self):
+        return {"name": self._shm.name, "width": self.width, "height": self.height}
+
+    def __setstate__(self, state):
+        self.__init__(state["width"], state["height"], name=state["name"])
+
+    def write(self, pixels: np.ndarray) -> None:
+        """Publish a frame (app side)."""
+        generation = self._generation = (self._generation + 1) & _GENERATION_MASK
+        self._header[_WRITING] = generation
+        np.copyto(self._buffers[generation & 1], pixels)
+        self._header[_PUBLISHED] = generation
+
+    def read_into(self, out: np.ndarray) -> bool:
+        """
+        Copy the newest frame into out if one was published since the last read
+        (kernel side). Returns False, leaving out untouched, if there is none or
+        the copy was torn.
+        """
+        header, buffers = self._header, self._buffers
+        if buffers is None:
+            return False
+
+        generation = int(header[_PUBLISHED])
+        if generation == self._consumed:
+            return False
+
+        scratch = self._scratch
+        np.copyto(scratch, buffers[generation & 1])
+
+        # Two or more generations ahead means the app reused this buffer while we copied
+        if (int(header[_WRITING]) - generation) & _GENERATION_MASK >= 2:
+            return False  # Torn - the newer frame is picked up on the next poll
+
+        np.copyto(out, scratch)
+        self._consumed = generation
+        return True
+
+    def close(self) -> None:
+        """Detach from the shared memory, freeing it if this side created it."""
+        self._header = self._buffers = None
+        try:
+            self._shm.close()
+        except BufferError:
+            pass  # A reader still holds a view; the mapping goes away with it
+        if self._owner_pid == os.getpid():
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
 class MessageBus:
     """
     Thread-safe message bus for IPC communication.
@@ -74,56 +192,82 @@ class MessageBus:
         # Kernel inbox (apps -> kernel)
         self._kernel_queue: Queue = MPQueue() if use_multiprocessing else Queue()
 
+        # The registries below are copy-on-write: writers build a new dict under
+        # _lock and rebind it, so readers on the message path never take the lock
+
         # App inboxes (kernel -> apps)
         self._app_queues: Dict[str, Queue] = {}
 
+        # Shared-memory frame slots (multiprocessing only)
+        self._frame_slots: Dict[str, FrameSlot] = {}
+
         # Subscribers for broadcast messages
-        self._subscribers: Dict[MessageType, List[Callable[[Message], None]]] = {}
+        self._subscribers: Dict[MessageType, Tuple[Callable[[Message], None], ...]] = {}
 
         self._running = True
 
-    def create_app_channel(self, app_id: str) -> "AppChannel":
-        """Create a dedicated channel for an app."""
+    def create_app_channel(
+        self, app_id: str, width: Optional[int] = None, height: Optional[int] = None
+    ) -> "AppChannel":
+        """
+        Create a dedicated channel for an app.
+
+        In multiprocessing mode, passing the frame size also allocates a shared
+        memory frame slot so frames don't have to be pickled through the queue.
+        """
         with self._lock:
+            frame_slot = None
             if self._use_mp:
-                self._app_queues[app_id] = MPQueue()
+                queue = MPQueue()
+                if width and height:
+                    frame_slot = FrameSlot(width, height)
+                    self._frame_slots = {**self._frame_slots, app_id: frame_slot}
             else:
-                self._app_queues[app_id] = Queue()
+                queue = Queue()
+            self._app_queues = {**self._app_queues, app_id: queue}
 
             return AppChannel(
                 app_id=app_id,
                 send_queue=self._kernel_queue,
-                recv_queue=self._app_queues[app_id],
+                recv_queue=queue,
+                frame_slot=frame_slot,
             )
 
     def remove_app_channel(self, app_id: str) -> None:
         """Remove an app's communication channel."""
         with self._lock:
             if app_id in self._app_queues:
-                del self._app_queues[app_id]
+                self._app_queues = {k: v for k, v in self._app_queues.items() if k != app_id}
+            frame_slot = self._frame_slots.get(app_id)
+            if frame_slot:
+                self._frame_slots = {k: v for k, v in self._frame_slots.items() if k != app_id}
+                frame_slot.close()
+
+    def get_frame_slots(self) -> Dict[str, FrameSlot]:
+        """Get the apps' shared-memory frame slots (an immutable snapshot - don't modify)."""
+        return self._frame_slots
 
     def send_to_app(self, app_id: str, message: Message) -> bool:
         """Send a message to a specific app."""
-        with self._lock:
-            if app_id not in self._app_queues:
-                log.warning(f"App {app_id} not found in message bus")
-                return False
+        queue = self._app_queues.get(app_id)
+        if queue is None:
+            log.warning(f"App {app_id} not found in message bus")
+            return False
 
-            try:
-                self._app_queues[app_id].put_nowait(message)
-                return True
-            except Exception as e:
-                log.error(f"Failed to send message to {app_id}: {e}")
-                return False
+        try:
+            queue.put_nowait(message)
+            return True
+        except Exception as e:
+            log.error(f"Failed to send message to {app_id}: {e}")
+            return False
 
     def broadcast(self, message: Message) -> None:
         """Broadcast a message to all apps."""
-        with self._lock:
-            for app_id, queue in self._app_queues.items():
-                try:
-                    queue.put_nowait(message)
-                except Exception as e:
-                    log.error(f"Failed to broadcast to {app_id}: {e}")
+        for app_id, queue in self._app_queues.items():
+            try:
+                queue.put_nowait(message)
+            except Exception as e:
+                log.error(f"Failed to broadcast to {app_id}: {e}")
 
     def receive_from_apps(self, timeout: float = 0.001) -> Optional[Message]:
         """Receive a message from any app (non-blocking)."""
@@ -132,12 +276,30 @@ class MessageBus:
         except Empty:
             return None
 
+    def receive_batch(self, max_messages: int = 64) -> List[Message]:
+        """
+        Drain up to max_messages pending messages from apps without blocking.
+
+        Only the newest FRAME_READY per app is kept - older frames would be
+        replaced before they could ever be displayed.
+        """
+        # Cheap pipe poll, without taking the queue's read lock, for the common idle tick
+        if self._kernel_queue.empty():
+            return []
+
+        messages = []
+        while len(messages) < max_messages:
+            try:
+                messages.append(self._kernel_queue.get_nowait())
+            except Empty:
+                break
+        return _coalesce_frames(messages)
+
     def subscribe(self, msg_type: MessageType, callback: Callable[[Message], None]) -> None:
         """Subscribe to a specific message type."""
         with self._lock:
-            if msg_type not in self._subscribers:
-                self._subscribers[msg_type] = []
-            self._subscribers[msg_type].append(callback)
+            callbacks = self._subscribers.get(msg_type, ()) + (callback,)
+            self._subscribers = {**self._subscribers, msg_type: callbacks}
 
     def shutdown(self) -> None:
         """Shutdown the message bus."""
@@ -150,6 +312,27 @@ class MessageBus:
         )
         self.broadcast(shutdown_msg)
 
+    def close(self) -> None:
+        """Release shared-memory frame slots. Call once apps have stopped."""
+        with self._lock:
+            frame_slots, self._frame_slots = self._frame_slots, {}
+            for frame_slot in frame_slots.values():
+                frame_slot.close()
+
+
+def _coalesce_frames(messages: List[Message]) -> List[Message]:
+    """Drop all but the last FRAME_READY from each source, keeping message order."""
+    latest: Dict[str, int] = {}
+    for i, msg in enumerate(messages):
+        if msg.type == MessageType.FRAME_READY:
+            latest[msg.source] = i
+
+    return [
+        msg
+        for i, msg in enumerate(messages)
+        if msg.type != MessageType.FRAME_READY or latest[msg.source] == i
+    ]
+
 
 @dataclass
 class AppChannel:
@@ -162,6 +345,7 @@ class AppChannel:
     app_id: str
     send_queue: Queue
     recv_queue: Queue
+    frame_slot: Optional[FrameSlot] = None
 
     def send(self, msg_type: MessageType, payload: Any = None, target: str = "kernel") -> None:
         """Send a message to the kernel or another app."""
@@ -185,7 +369,11 @@ class AppChannel:
 
     def submit_frame(self, framebuffer: Any) -> None:
         """Submit a rendered frame to the kernel."""
-        self.send(MessageType.FRAME_READY, payload=framebuffer)
+        if self.frame_slot:
+            # Published through shared memory; the kernel polls the slot
+            self.frame_slot.write(framebuffer.data)
+        else:
+            self.send(MessageType.FRAME_READY, payload=framebuffer)
 
     def report_ready(self) -> None:
         """Report that the app is ready to run."""
@@ -7,13 +7,14 @@ The main render loop runs here and must never block.
 
 import logging
 import os
+import queue
 import threading
 import time
-from typing import TYPE_CHECKING, Callable, Dict, Optional, Type
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Type
 
 from .config import SystemConfig
 from .display import Display, FrameBuffer
-from .ipc import MessageBus, MessageType
+from .ipc import Message, MessageBus, MessageType
 from .sandbox import AppWrapper, Sandbox
 from .scheduler import AppScheduler
 
@@ -27,10 +28,24 @@ _frame_callback: Optional[Callable[[FrameBuffer], None]] = None
 _app_change_callback: Optional[Callable[[str], None]] = None
 
 
+def _guard_frame_callback(
+    callback: Callable[[FrameBuffer], None],
+) -> Callable[[FrameBuffer], None]:
+    """Wrap a frame callback once so the render loop needn't guard every call."""
+
+    def guarded(frame: FrameBuffer) -> None:
+        try:
+            callback(frame)
+        except Exception:
+            pass  # Don't let web callback errors affect rendering
+
+    return guarded
+
+
 def set_frame_callback(callback: Optional[Callable[[FrameBuffer], None]]) -> None:
     """Set a callback to receive frame updates."""
     global _frame_callback
-    _frame_callback = callback
+    _frame_callback = _guard_frame_callback(callback) if callback else None
 
 
 def set_app_change_callback(callback: Optional[Callable[[str], None]]) -> None:
@@ -65,22 +80,41 @@ class Kernel:
         self._app_instances: Dict[str, "BaseApp"] = {}
         self._app_counter = 0
 
+        # Kernel-side copies of apps' latest frames (from shared memory or FRAME_READY)
+        self._app_frames: Dict[str, FrameBuffer] = {}
+
+        # IPC message handlers, looked up once per message
+        self._message_handlers: Dict[MessageType, Callable[[Message], None]] = {
+            MessageType.FRAME_READY: self._on_frame_ready,
+            MessageType.APP_READY: self._on_app_ready,
+            MessageType.APP_ERROR: self._on_app_error,
+        }
+
+        # Apps unregistered since the last tick, whose buffers the render thread
+        # still has to let go of: (app_id, the app's framebuffer)
+        self._removed_apps: queue.SimpleQueue = queue.SimpleQueue()
+
+        # Frames received this tick, handed to the scheduler in one batch
+        self._pending_frames: List[Tuple[str, FrameBuffer]] = []
+
         # Runtime state
         self._running = False
+        self._frame_time = 1.0 / 60  # Render loop period (60 FPS)
         self._render_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()  # Set by stop(); run() blocks on it
 
-        # Paths
+        # Paths (resolved once)
         self._base_path = os.path.dirname(os.path.dirname(__file__))
-        self._fonts_path = os.path.join(self._base_path, "..", "..", "fonts")
-        self._images_path = os.path.join(self._base_path, "..", "..", "images")
+        self._fonts_path = os.path.abspath(os.path.join(self._base_path, "..", "..", "fonts"))
+        self._images_path = os.path.abspath(os.path.join(self._base_path, "..", "..", "images"))
 
     @property
     def fonts_path(self) -> str:
-        return os.path.abspath(self._fonts_path)
+        return self._fonts_path
 
     @property
     def images_path(self) -> str:
-        return os.path.abspath(self._images_path)
+        return self._images_path
 
     @property
     def app_instances(self) -> Dict[str, "BaseApp"]:
@@ -92,8 +126,12 @@ class Kernel:
         return self.scheduler.get_current_app()
 
     def create_framebuffer(self) -> FrameBuffer:
-        """Create a framebuffer for apps to render to."""
-        return self.display.create_framebuffer()
+        """Get a framebuffer for apps to render to (from the display's pool)."""
+        return self.display.pool.acquire()
+
+    def release_framebuffer(self, framebuffer: FrameBuffer) -> None:
+        """Return a framebuffer from create_framebuffer() once nothing uses it."""
+        self.display.pool.release(framebuffer)
 
     def register_app(
         self,
@@ -112,7 +150,9 @@ class Kernel:
         app_id = f"{app_class.__name__.lower()}_{self._app_counter}"
 
         # Create IPC channel for the app
-        channel = self.message_bus.create_app_channel(app_id)
+        channel = self.message_bus.create_app_channel(
+            app_id, self.display.width, self.display.height
+        )
 
         # Create framebuffer for the app
         framebuffer = self.create_framebuffer()
@@ -129,7 +169,9 @@ class Kernel:
 
         # Store and wrap for sandboxing
         self._app_instances[app_id] = app
-        wrapper = AppWrapper(app, channel)
+        app_cpus = self.config.scheduler.app_cpus
+        cpu = app_cpus[(self._app_counter - 1) % len(app_cpus)] if app_cpus else None
+        wrapper = AppWrapper(app, channel, cpu=cpu)
         self.sandbox.register(app_id, wrapper)
 
         # Add to scheduler
@@ -159,30 +201,99 @@ class Kernel:
         self.sandbox.unregister(app_id)
         self.scheduler.remove_app(app_id)
         self.message_bus.remove_app_channel(app_id)
-        del self._app_instances[app_id]
+
+        # The render thread may still hold the app's frame (mid-poll, pending or on
+        # screen), so it frees the buffers itself at the start of its next tick
+        self._removed_apps.put((app_id, self._app_instances.pop(app_id).fb))
+        if not (self._render_thread and self._render_thread.is_alive()):
+            self._release_removed_apps()
 
         log.info(f"Unregistered app '{app_id}'")
         return True
 
+    def _release_removed_apps(self) -> None:
+        """Return unregistered apps' buffers to the pool (on the render thread)."""
+        while True:
+            try:
+                app_id, app_fb = self._removed_apps.get_nowait()
+            except queue.Empty:
+                return
+
+            # A tick that raced with unregister_app may have re-queued or re-submitted
+            # the app's frame; drop it everywhere before the buffer is reused
+            self.scheduler.remove_app(app_id)
+            frame = self._app_frames.pop(app_id, None)
+            if frame:
+                self.release_framebuffer(frame)
+            self.release_framebuffer(app_fb)
+
     def _process_messages(self) -> None:
         """Process pending IPC messages (non-blocking)."""
-        # Process up to 10 messages per tick to avoid starvation
-        for _ in range(10):
-            msg = self.message_bus.receive_from_apps(timeout=0.0001)
-            if msg is None:
-                break
-
-            if msg.type == MessageType.FRAME_READY:
-                # App submitted a frame
-                self.scheduler.submit_frame(msg.source, msg.payload)
-
-            elif msg.type == MessageType.APP_READY:
-                log.debug(f"App '{msg.source}' reported ready")
+        # Drain what's pending in one go; stale frames are already coalesced away
+        handlers = self._message_handlers
+        for msg in self.message_bus.receive_batch():
+            handler = handlers.get(msg.type)
+            if handler:
+                handler(msg)
+
+    def _on_frame_ready(self, msg: Message) -> None:
+        """App submitted a frame (thread-mode channels)."""
+        if msg.source not in self._app_instances:
+            return  # Sent just before the app was unregistered
+
+        # A thread-mode app keeps drawing into the framebuffer it sent, so the
+        # scheduler gets our own copy, like frames from shared memory
+        frame = self._app_frame(msg.source)
+        msg.payload.copy_into(frame)
+        self._pending_frames.append((msg.source, frame))
+
+    def _app_frame(self, app_id: str) -> FrameBuffer:
+        """Get the kernel-side framebuffer that holds an app's latest frame."""
+        frame = self._app_frames.get(app_id)
+        if frame is None:
+            frame = self._app_frames[app_id] = self.create_framebuffer()
+        return frame
+
+    def _on_app_ready(self, msg: Message) -> None:
+        """App finished initialization."""
+        log.debug(f"App '{msg.source}' reported ready")
+
+    def _on_app_error(self, msg: Message) -> None:
+        """App reported an error."""
+        log.error(f"App '{msg.source}' error: {msg.payload}")
+
+    def _poll_shared_frames(self) -> None:
+        """Pick up frames apps published through shared memory since the last tick."""
+        app_instances = self._app_instances
+        for app_id, frame_slot in self.message_bus.get_frame_slots().items():
+            if app_id not in app_instances:
+                continue  # Unregistered after this snapshot was taken
+            # The app keeps rendering into the slot, so the scheduler gets our own copy
+            frame = self._app_frame(app_id)
+            if frame_slot.read_into(frame.data):
+                self._pending_frames.append((app_id, frame))
+
+    def _raise_render_priority(self) -> None:
+        """
+        Schedule the calling (render) thread ahead of the app processes.
 
-            elif msg.type == MessageType.APP_ERROR:
-                log.error(f"App '{msg.source}' error: {msg.payload}")
+        SCHED_FIFO needs root or CAP_SYS_NICE; without it, fall back to a higher
+        nice value (which needs the same privilege to go below 0, so may also fail).
+        Priority 1 stays below the rgbmatrix refresh thread's own realtime priority.
+        """
+        if hasattr(os, "sched_setscheduler"):
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(1))
+                log.info("Render loop running with SCHED_FIFO priority")
+                return
+            except OSError as e:
+                log.debug(f"SCHED_FIFO unavailable for render loop: {e}")
 
-            # Add more message handlers as needed
+        try:
+            os.nice(-5)
+            log.info("Render loop running at nice -5")
+        except OSError as e:
+            log.warning(f"Could not raise render loop priority: {e}")
 
     def _render_loop(self) -> None:
         """
@@ -191,16 +302,34 @@ class Kernel:
         This loop must NEVER block. All operations must be non-blocking
         or have strict timeouts.
         """
-        target_fps = 60
-        frame_time = 1.0 / target_fps
+        frame_time = self._frame_time
+
+        # Pin this thread so the framebuffer working set stays in one core's cache
+        render_cpu = self.config.scheduler.render_cpu
+        if render_cpu is not None and hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(0, {render_cpu})
+            except OSError as e:
+                log.warning(f"Could not pin render loop to CPU {render_cpu}: {e}")
+
+        if self.config.scheduler.realtime:
+            self._raise_render_priority()
 
         log.info("Render loop started")
 
+        # Absolute deadlines on the monotonic clock, so sleep overshoot doesn't accumulate
+        deadline = time.monotonic()
+
         while self._running:
-            loop_start = time.time()
+            # Free the buffers of apps unregistered since the last tick
+            self._release_removed_apps()
 
-            # Process IPC messages (non-blocking)
+            # Process IPC messages and shared-memory frames (non-blocking)
             self._process_messages()
+            self._poll_shared_frames()
+            if self._pending_frames:
+                self.scheduler.submit_frames(self._pending_frames)
+                self._pending_frames.clear()
 
             # Get current frame from scheduler
             frame = self.scheduler.tick()
@@ -209,18 +338,19 @@ class Kernel:
             if frame:
                 self.display.render(frame)
 
-                # Notify web interface if callback is set
-                if _frame_callback:
-                    try:
-                        _frame_callback(frame)
-                    except Exception:
-                        pass  # Don't let web callback errors affect rendering
+                # Notify web interface if callback is set (already error-guarded)
+                frame_callback = _frame_callback
+                if frame_callback:
+                    frame_callback(frame)
 
-            # Frame timing - sleep for remainder of frame time
-            elapsed = time.time() - loop_start
-            sleep_time = frame_time - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            # Frame timing - sleep until this frame's deadline
+            deadline += frame_time
+            slack = deadline - time.monotonic()
+            if slack > 0:
+                time.sleep(slack)
+            elif slack < -frame_time:
+                # Fell more than a frame behind - resync instead of bursting to catch up
+                deadline -= slack
 
         log.info("Render loop stopped")
 
@@ -234,6 +364,7 @@ class Kernel:
             return
 
         self._running = True
+        self._stop_event.clear()
 
         # Start all apps in their sandboxes
         self.sandbox.start_all()
@@ -253,8 +384,9 @@ class Kernel:
         self.start()
 
         try:
-            while self._running:
-                time.sleep(0.1)
+            # Sleep until stop() instead of waking up periodically to check
+            if self._running:
+                self._stop_event.wait()
         except KeyboardInterrupt:
             log.info("Keyboard interrupt received")
         finally:
@@ -265,6 +397,7 @@ class Kernel:
         log.info("Stopping MatrixOS kernel...")
 
         self._running = False
+        self._stop_event.set()
 
         # Stop all apps
         self.sandbox.stop_all()
@@ -276,6 +409,12 @@ class Kernel:
         if self._render_thread and self._render_thread.is_alive():
             self._render_thread.join(timeout=2.0)
 
+        # The render thread is gone, so release what it didn't get to
+        self._release_removed_apps()
+
+        # Free shared frame memory once nothing reads it anymore
+        self.message_bus.close()
+
         # Shutdown display
         self.display.shutdown()
 
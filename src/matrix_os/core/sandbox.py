@@ -7,6 +7,8 @@ All apps run in separate processes for true isolation from the render loop.
 import logging
 import logging.handlers
 import multiprocessing
+import os
+import queue
 import threading
 from typing import TYPE_CHECKING, Dict, Optional
 
@@ -19,6 +21,9 @@ log = logging.getLogger(__name__)
 # Shared queue for forwarding logs from child processes to main process
 _log_queue: Optional[multiprocessing.Queue] = None
 
+# Bound for the log queue, so a burst of app logging can't grow it without limit
+LOG_QUEUE_SIZE = 4096
+
 
 def set_log_queue(queue: multiprocessing.Queue) -> None:
     """Set the log queue for child processes to use."""
@@ -31,6 +36,47 @@ def get_log_queue() -> Optional[multiprocessing.Queue]:
     return _log_queue
 
 
+# Imported once in the fork server so each app process starts with them warm
+_FORKSERVER_PRELOAD = ["numpy", "PIL.Image", "matrix_os.apps.base"]
+
+
+def use_forkserver() -> bool:
+    """
+    Start app processes from a fork server with the heavy modules preloaded.
+
+    Call once at program start, before any app or log queue is created. Apps
+    are forked from a small single-threaded server instead of the kernel (which
+    by then runs the render, web and log threads), sharing the preloaded modules
+    copy-on-write. Returns False where forkserver is unavailable (Windows), in
+    which case the platform default is kept.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return False
+
+    multiprocessing.set_start_method("forkserver", force=True)
+    multiprocessing.set_forkserver_preload(_FORKSERVER_PRELOAD)
+    return True
+
+
+class _DropOldestQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a bounded queue that never blocks an app on logging.
+
+    When the queue is full the oldest record is dropped to make room; if none is
+    readable yet (still in another process's feeder thread), the new one is dropped.
+    """
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            try:
+                self.queue.get_nowait()
+                self.queue.put_nowait(record)
+            except (queue.Empty, queue.Full):
+                pass
+
+
 def _setup_child_logging(log_queue: multiprocessing.Queue) -> None:
     """Set up logging in child process to forward to main process."""
     # Remove all existing handlers from root logger
@@ -39,15 +85,20 @@ def _setup_child_logging(log_queue: multiprocessing.Queue) -> None:
         root.removeHandler(handler)
 
     # Add queue handler to forward logs to main process
-    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler = _DropOldestQueueHandler(log_queue)
     queue_handler.setLevel(logging.INFO)
     root.addHandler(queue_handler)
     root.setLevel(logging.INFO)
 
 
-def _process_run_loop(app: "BaseApp", send_queue, recv_queue, app_id: str, log_queue) -> None:
+def _process_run_loop(
+    app: "BaseApp", send_queue, recv_queue, app_id: str, log_queue, frame_slot=None
+) -> None:
     """
     Run loop for apps. Runs in a separate process.
+
+    When a shared-memory frame slot is given, frames are published through it
+    instead of being sent as FRAME_READY messages.
     """
     import time
     from queue import Empty
@@ -68,11 +119,21 @@ def _process_run_loop(app: "BaseApp", send_queue, recv_queue, app_id: str, log_q
         except Exception as e:
             log.error(f"[{app_id}] Failed to send: {e}")
 
-    def recv_msg(timeout=0.001):
-        try:
-            return recv_queue.get(timeout=timeout)
-        except Empty:
-            return None
+    def pause():
+        nonlocal paused
+        paused = True
+
+    def resume():
+        nonlocal paused
+        paused = False
+
+    # Kernel message handlers, built once; a handler returning True stops the app
+    handlers = {
+        MessageType.APP_STOP: lambda: True,
+        MessageType.SYSTEM_SHUTDOWN: lambda: True,
+        MessageType.APP_PAUSE: pause,
+        MessageType.APP_RESUME: resume,
+    }
 
     try:
         log.debug(f"App '{app.manifest.name}' initializing in process...")
@@ -81,41 +142,52 @@ def _process_run_loop(app: "BaseApp", send_queue, recv_queue, app_id: str, log_q
         log.debug(f"App '{app.manifest.name}' ready")
 
         frame_interval = 1.0 / max(1, app.manifest.framerate)
-        last_frame_time = 0.0
+
+        # Bind hot attributes to locals once, outside the loop
+        time_fn = time.monotonic
+        recv = recv_queue.get
+        recv_nowait = recv_queue.get_nowait
+        update = app.update
+        render = app.render
+        write_frame = frame_slot.write if frame_slot else None
+
+        next_deadline = time_fn()
 
         while running:
-            # Check for messages from kernel
-            msg = recv_msg(timeout=0.001)
+            # Block until the next frame is due, waking early for kernel messages,
+            # instead of polling the queue every millisecond
+            wait = 0.1 if paused else max(0.0, next_deadline - time_fn())
+
+            try:
+                # Already due (or behind): just check the queue without a timed wait
+                msg = recv(timeout=wait) if wait > 0 else recv_nowait()
+            except Empty:
+                msg = None
+
             if msg:
-                if msg.type == MessageType.APP_STOP:
-                    break
-                elif msg.type == MessageType.APP_PAUSE:
-                    paused = True
-                elif msg.type == MessageType.APP_RESUME:
-                    paused = False
-                elif msg.type == MessageType.SYSTEM_SHUTDOWN:
+                handler = handlers.get(msg.type)
+                if handler and handler():
                     break
+                continue  # Drain any further messages before rendering
 
             if paused:
-                time.sleep(0.01)
                 continue
 
             # Frame timing
-            current_time = time.time()
-            if current_time - last_frame_time >= frame_interval:
+            now = time_fn()
+            if now >= next_deadline:
                 try:
-                    app.update()
-                    framebuffer = app.render()
-                    if framebuffer:
-                        send_msg(MessageType.FRAME_READY, payload=framebuffer)
+                    # Idle apps skip render and publish; the kernel keeps their last frame
+                    if update() is not False and app.dirty:
+                        framebuffer = render()
+                        if framebuffer and write_frame:
+                            write_frame(framebuffer.data)
+                        elif framebuffer:
+                            send_msg(MessageType.FRAME_READY, payload=framebuffer)
                 except Exception as e:
                     log.error(f"App '{app.manifest.name}' render error: {e}")
 
-                last_frame_time = current_time
-            else:
-                sleep_time = frame_interval - (current_time - last_frame_time)
-                if sleep_time > 0.001:
-                    time.sleep(sleep_time * 0.9)
+                next_deadline = now + frame_interval
 
     except Exception as e:
         log.exception(f"App {app.manifest.name} crashed: {e}")
@@ -123,6 +195,8 @@ def _process_run_loop(app: "BaseApp", send_queue, recv_queue, app_id: str, log_q
     finally:
         log.debug(f"App '{app.manifest.name}' stopping...")
         app.on_stop()
+        if frame_slot:
+            frame_slot.close()
 
 
 class AppWrapper:
@@ -130,9 +204,10 @@ class AppWrapper:
     Wraps an app instance for process-based execution.
     """
 
-    def __init__(self, app: "BaseApp", channel: "AppChannel"):
+    def __init__(self, app: "BaseApp", channel: "AppChannel", cpu: Optional[int] = None):
         self.app = app
         self.channel = channel
+        self.cpu = cpu  # CPU to pin the app process to (None = unpinned)
         self._running = False
         self._paused = False
         self._process: Optional[multiprocessing.Process] = None
@@ -152,6 +227,7 @@ class AppWrapper:
                 self.channel.recv_queue,
                 self.channel.app_id,
                 get_log_queue(),
+                self.channel.frame_slot,
             ),
             name=f"matrixos-{self.app.manifest.name}",
             daemon=True,
@@ -159,6 +235,12 @@ class AppWrapper:
         self._process.start()
         log.info(f"Started app '{self.app.manifest.name}' in process {self._process.pid}")
 
+        if self.cpu is not None and hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(self._process.pid, {self.cpu})
+            except OSError as e:
+                log.warning(f"Could not pin app '{self.app.manifest.name}' to CPU {self.cpu}: {e}")
+
     def stop(self, timeout: float = 2.0) -> None:
         """Stop the app gracefully."""
         self._running = False
@@ -186,6 +268,11 @@ class AppWrapper:
 class Sandbox:
     """
     Manages process-based execution of apps.
+
+    Apps and everything passed to their process (the app instance, queues,
+    frame slot) must be picklable: under the forkserver and spawn start methods
+    (see use_forkserver) the app's module is re-imported in the child rather
+    than inherited, so apps must be defined at module level.
     """
 
     def __init__(self):
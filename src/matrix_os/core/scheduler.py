@@ -5,10 +5,8 @@ Manages which app is currently displayed and handles transitions.
 """
 
 import logging
-import threading
 import time
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from .display import FrameBuffer
@@ -18,15 +16,27 @@ from .config import SchedulerConfig
 log = logging.getLogger(__name__)
 
 
-@dataclass
 class ScheduledApp:
-    """An app scheduled for display."""
+    """An app scheduled for display (slotted - no per-instance __dict__)."""
 
-    app_id: str
-    priority: int = 0  # Higher = more important
-    duration: float = 15.0  # How long to display (seconds)
-    is_overlay: bool = False  # Overlay on top of other apps
-    is_persistent: bool = False  # Always running in background
+    __slots__ = ("app_id", "priority", "duration", "is_overlay", "is_persistent")
+
+    def __init__(
+        self,
+        app_id: str,
+        priority: int = 0,  # Higher = more important
+        duration: float = 15.0,  # How long to display (seconds)
+        is_overlay: bool = False,  # Overlay on top of other apps
+        is_persistent: bool = False,  # Always running in background
+    ):
+        self.app_id = app_id
+        self.priority = priority
+        self.duration = duration
+        self.is_overlay = is_overlay
+        self.is_persistent = is_persistent
+
+    def __repr__(self) -> str:
+        return f"ScheduledApp({self.app_id!r}, priority={self.priority}, duration={self.duration})"
 
 
 class AppScheduler:
@@ -40,21 +50,38 @@ class AppScheduler:
     - Smooth transitions
     """
 
+    __slots__ = (
+        "config",
+        "_apps",
+        "_rotation_order",
+        "_rotation_index",
+        "_persistent_apps",
+        "_current_app",
+        "_current_app_start",
+        "_current_deadline",
+        "_overlay_app",
+        "_frames",
+        "_on_app_change",
+    )
+
     def __init__(self, config: SchedulerConfig):
         self.config = config
 
         # Scheduled apps
         self._apps: Dict[str, ScheduledApp] = {}
         self._rotation_order: List[str] = []
+        self._rotation_index: Dict[str, int] = {}  # app_id -> position in _rotation_order
+        self._persistent_apps: List[str] = []  # Apps that always run, in scheduling order
 
         # Current state
         self._current_app: Optional[str] = None
-        self._current_app_start: float = 0.0
+        self._current_app_start: float = 0.0  # time.monotonic()
+        self._current_deadline: float = 0.0  # When the current app's duration is up
         self._overlay_app: Optional[str] = None
 
-        # Frame buffers from apps
+        # Latest frame per app. Each access is a single dict operation, which is
+        # atomic under the GIL, so the per-tick frame path takes no lock
         self._frames: Dict[str, "FrameBuffer"] = {}
-        self._frame_lock = threading.Lock()
 
         # Callbacks
         self._on_app_change: Optional[Callable[[str, str], None]] = None
@@ -79,7 +106,11 @@ class AppScheduler:
             is_persistent=is_persistent,
         )
 
+        if is_persistent and app_id not in self._persistent_apps:
+            self._persistent_apps.append(app_id)
+
         if not is_overlay:
+            self._rotation_index[app_id] = len(self._rotation_order)
             self._rotation_order.append(app_id)
         else:
             self._overlay_app = app_id
@@ -87,7 +118,7 @@ class AppScheduler:
         # Start with first app
         if self._current_app is None and not is_overlay:
             self._current_app = app_id
-            self._current_app_start = time.time()
+            self._start_current_app()
 
         log.info(f"Scheduled app '{app_id}' (priority={priority}, duration={duration}s)")
 
@@ -95,19 +126,37 @@ class AppScheduler:
         """Remove an app from the schedule."""
         if app_id in self._apps:
             del self._apps[app_id]
-        if app_id in self._rotation_order:
+        removed_idx = self._rotation_index.get(app_id)
+        if removed_idx is not None:
             self._rotation_order.remove(app_id)
+            self._rotation_index = {a: i for i, a in enumerate(self._rotation_order)}
         if app_id == self._overlay_app:
             self._overlay_app = None
+        if app_id in self._persistent_apps:
+            self._persistent_apps.remove(app_id)
+
+        self._frames.pop(app_id, None)
+
+        # Removing the displayed app moves on to the one that followed it right away
+        if app_id == self._current_app:
+            order = self._rotation_order
+            if order:
+                # An app outside the rotation (a forced overlay) restarts it at 0
+                self._current_app = order[(removed_idx or 0) % len(order)]
+                self._start_current_app()
+            else:
+                self._current_app = None
 
-        with self._frame_lock:
-            if app_id in self._frames:
-                del self._frames[app_id]
+            if self._on_app_change:
+                self._on_app_change(app_id, self._current_app)
 
     def submit_frame(self, app_id: str, framebuffer: "FrameBuffer") -> None:
         """Submit a frame from an app."""
-        with self._frame_lock:
-            self._frames[app_id] = framebuffer
+        self._frames[app_id] = framebuffer
+
+    def submit_frames(self, frames: Iterable[Tuple[str, "FrameBuffer"]]) -> None:
+        """Submit a batch of (app_id, frame) pairs; later frames win."""
+        self._frames.update(frames)
 
     def get_current_app(self) -> Optional[str]:
         """Get the currently displayed app ID."""
@@ -115,22 +164,9 @@ class AppScheduler:
 
     def get_active_apps(self) -> List[str]:
         """Get list of apps that should be running."""
-        active = []
-
-        # Current display app
-        if self._current_app:
-            active.append(self._current_app)
-
-        # Overlay app
-        if self._overlay_app:
-            active.append(self._overlay_app)
-
-        # Persistent apps
-        for app_id, sched in self._apps.items():
-            if sched.is_persistent and app_id not in active:
-                active.append(app_id)
-
-        return active
+        # Current display app, overlay app, then persistent apps - without duplicates
+        candidates = (self._current_app, self._overlay_app, *self._persistent_apps)
+        return list(dict.fromkeys(app_id for app_id in candidates if app_id))
 
     def tick(self) -> Optional["FrameBuffer"]:
         """
@@ -138,25 +174,20 @@ class AppScheduler:
 
         This is called by the render loop and must be fast and non-blocking.
         """
-        current_time = time.time()
-
-        # Check if we need to rotate to next app
-        if self._current_app and len(self._rotation_order) > 1:
-            sched = self._apps.get(self._current_app)
-            if sched and (current_time - self._current_app_start) >= sched.duration:
-                self._rotate_next()
-
-        # Get current frame
-        with self._frame_lock:
-            # Start with base app frame
-            if self._current_app and self._current_app in self._frames:
-                frame = self._frames[self._current_app]
-            else:
-                return None
+        # Check if we need to rotate to next app - a single compare until it's due
+        if (
+            self._current_app
+            and len(self._rotation_order) > 1
+            and time.monotonic() >= self._current_deadline
+        ):
+            self._rotate_next()
+
+        # Get current frame (None until the app has submitted one)
+        frame = self._frames.get(self._current_app)
 
-            # TODO: Composite overlay if present
-            # For now, just return the base frame
-            return frame
+        # TODO: Composite overlay if present
+        # For now, just return the base frame
+        return frame
 
     def _rotate_next(self) -> None:
         """Rotate to the next app in order."""
@@ -165,20 +196,25 @@ class AppScheduler:
 
         old_app = self._current_app
 
-        try:
-            current_idx = self._rotation_order.index(self._current_app)
-            next_idx = (current_idx + 1) % len(self._rotation_order)
-            self._current_app = self._rotation_order[next_idx]
-        except ValueError:
-            self._current_app = self._rotation_order[0]
+        # An app outside the rotation (e.g. removed or a forced overlay) restarts it at 0
+        current_idx = self._rotation_index.get(self._current_app, -1)
+        next_idx = (current_idx + 1) % len(self._rotation_order)
+        self._current_app = self._rotation_order[next_idx]
 
-        self._current_app_start = time.time()
+        self._start_current_app()
 
         if self._on_app_change and old_app != self._current_app:
             self._on_app_change(old_app, self._current_app)
 
         log.debug(f"Rotated from '{old_app}' to '{self._current_app}'")
 
+    def _start_current_app(self) -> None:
+        """Start the display period of the (just switched to) current app."""
+        self._current_app_start = time.monotonic()
+        sched = self._apps.get(self._current_app)
+        duration = sched.duration if sched else self.config.default_app_duration
+        self._current_deadline = self._current_app_start + duration
+
     def force_app(self, app_id: str) -> bool:
         """Force display of a specific app."""
         if app_id not in self._apps:
@@ -186,7 +222,7 @@ class AppScheduler:
 
         old_app = self._current_app
         self._current_app = app_id
-        self._current_app_start = time.time()
+        self._start_current_app()
 
         if self._on_app_change and old_app != app_id:
             self._on_app_change(old_app, app_id)
@@ -18,10 +18,8 @@ import logging
 import os
 import threading
 
-from matrix_os.apps import BasicClockApp, DVDApp, EarthApp, ImageViewerApp, SlackStatusApp
-from matrix_os.apps.stocks import StocksApp
-from matrix_os.apps.weather import WeatherApp
 from matrix_os.core import Kernel, SystemConfig
+from matrix_os.core.sandbox import use_forkserver
 
 # Setup logging
 logging.basicConfig(
@@ -37,6 +35,21 @@ logging.getLogger("uvicorn").setLevel(logging.WARNING)
 logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
 logging.getLogger("uvicorn.error").setLevel(logging.WARNING)
 
+# Apps to register, in rotation order: (app class name in matrix_os.apps, register_app kwargs)
+# Each app runs in its own process and communicates with the kernel via IPC.
+# Only the apps listed here are imported.
+APPS = (
+    # Fun/visual apps
+    ("DVDApp", {"duration": 15}),
+    ("EarthApp", {"duration": 15}),
+    ("StocksApp", {"symbol": "NVDA", "duration": 15}),
+    ("StocksApp", {"symbol": "VTI", "duration": 15}),
+    ("WeatherApp", {"duration": 15}),
+    ("SlackStatusApp", {"duration": 15}),
+    ("BasicClockApp", {"duration": 15}),
+    # ("BinaryClockApp", {"duration": 15}),
+)
+
 
 def setup_web_integration(kernel):
     """Set up web interface integration with the kernel."""
@@ -88,7 +101,7 @@ def setup_web_logging():
     import multiprocessing
     from logging.handlers import QueueListener
 
-    from matrix_os.core.sandbox import set_log_queue
+    from matrix_os.core.sandbox import LOG_QUEUE_SIZE, set_log_queue
     from matrix_os.web import WebLogHandler, get_shared_state
 
     shared_state = get_shared_state()
@@ -100,7 +113,7 @@ def setup_web_logging():
     root_logger.addHandler(web_handler)
 
     # Set up multiprocessing queue for child process logs
-    log_queue = multiprocessing.Queue()
+    log_queue = multiprocessing.Queue(maxsize=LOG_QUEUE_SIZE)
     set_log_queue(log_queue)
 
     # Get the existing console handler to also receive child process logs
@@ -153,8 +166,14 @@ def run_web_server_thread(host: str = "0.0.0.0", port: int = 8000):
     server = uvicorn.Server(config)
 
     def run_server():
-        # Create a new event loop for this thread
-        loop = asyncio.new_event_loop()
+        # Create a new event loop for this thread (uvloop's when installed, as
+        # uvicorn itself would pick - serve() on our own loop bypasses that choice)
+        try:
+            import uvloop
+
+            loop = uvloop.new_event_loop()
+        except ImportError:
+            loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         loop.run_until_complete(server.serve())
 
@@ -184,6 +203,9 @@ def main():
     )
     args = parser.parse_args()
 
+    # Start apps from a warm fork server - must precede creating any queues
+    use_forkserver()
+
     # Set up web logging early to capture all logs
     setup_web_logging()
 
@@ -198,22 +220,16 @@ def main():
     # Set up web integration
     setup_web_integration(kernel)
 
-    # Register apps
-    # Each app runs in its own process and communicates with the kernel via IPC
+    # Register apps, importing each app's module on first use
+    from matrix_os import apps
 
-    # Fun/visual apps
-    kernel.register_app(DVDApp, duration=15)
-    kernel.register_app(EarthApp, duration=15)
-    kernel.register_app(StocksApp, symbol="NVDA", duration=15)
-    kernel.register_app(StocksApp, symbol="VTI", duration=15)
-    kernel.register_app(WeatherApp, duration=15)
-    kernel.register_app(SlackStatusApp, duration=15)
-    kernel.register_app(BasicClockApp, duration=15)
-    # kernel.register_app(BinaryClockApp, duration=15)
+    register_app = kernel.register_app
+    for app_name, kwargs in APPS:
+        register_app(getattr(apps, app_name), **kwargs)
 
     # Static image
     if os.path.exists(nvidia_path := os.path.join(kernel.images_path, "nvidia.png")):
-        kernel.register_app(ImageViewerApp, image_path=nvidia_path, duration=10)
+        register_app(apps.ImageViewerApp, image_path=nvidia_path, duration=10)
 
     log.info("All apps registered. Starting kernel...")
 
@@ -13,18 +13,25 @@ import io
 import json
 import logging
 import os
+import queue
 import threading
 import time
-from collections import deque
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Deque, Dict, List, Optional
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
+import numpy as np
 from fastapi import FastAPI, Request
 from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from PIL import Image
 from sse_starlette.sse import EventSourceResponse
 
+try:
+    import orjson  # Faster JSON encoding, when installed
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
     from ..core.display import FrameBuffer
 
@@ -34,6 +41,16 @@ log = logging.getLogger(__name__)
 TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "templates")
 STATIC_DIR = os.path.join(os.path.dirname(__file__), "static")
 
+# Multipart header of each MJPEG frame, up to the Content-Length value
+_MJPEG_PART_HEADER = b"--frame\r\nContent-Type: image/jpeg\r\nContent-Length: "
+
+# Logs kept for the web log viewer (a power of two, so ring slots are a mask away)
+_LOG_HISTORY = 1024
+_LOG_MASK = _LOG_HISTORY - 1
+
+# Seconds between keep-alive pings on idle log streams (so proxies don't drop them)
+_SSE_PING_INTERVAL = 15
+
 
 @dataclass
 class AppInfo:
@@ -53,12 +70,29 @@ class SharedState:
     Shared state between kernel and web server.
 
     Thread-safe container for the current frame and log messages.
+
+    The current frame is an immutable snapshot, replaced (not modified) whenever
+    the display changes, so readers share it without locking or copying.
     """
 
     _frame: Optional["FrameBuffer"] = None
     _frame_lock: threading.Lock = field(default_factory=threading.Lock)
-    _logs: Deque[Dict] = field(default_factory=lambda: deque(maxlen=1000))
-    _log_lock: threading.Lock = field(default_factory=threading.Lock)
+    _frame_version: int = 0
+    # Frame stream waiters, woken when the frame changes (copy-on-write under _frame_lock)
+    _frame_waiters: Tuple[Tuple[asyncio.AbstractEventLoop, asyncio.Event], ...] = ()
+    # Newest logs as a ring of (record, record as JSON): log n lives at _log_ring[n & _LOG_MASK]
+    _log_ring: List[Optional[Tuple[Dict, str]]] = field(
+        default_factory=lambda: [None] * _LOG_HISTORY
+    )
+    _log_total: int = 0  # Logs ever added; only grows, so it doubles as a read cursor
+    # Logs handed off by add_log, moved into the ring by readers. SimpleQueue puts
+    # never block, so logging threads don't contend with each other or the readers.
+    _log_incoming: queue.SimpleQueue = field(default_factory=queue.SimpleQueue)
+    _log_lock: threading.Lock = field(default_factory=threading.Lock)  # Ring writers
+    # Log stream waiters, woken on each new log (copy-on-write under _log_lock)
+    _log_waiters: Tuple[Tuple[asyncio.AbstractEventLoop, asyncio.Event], ...] = ()
+    # Copy-on-write: writers rebind a new dict (of new AppInfos) under _apps_lock,
+    # so readers need no lock
     _apps: Dict[str, AppInfo] = field(default_factory=dict)
     _apps_lock: threading.Lock = field(default_factory=threading.Lock)
     _current_app: Optional[str] = None
@@ -68,51 +102,179 @@ class SharedState:
 
     def set_frame(self, frame: "FrameBuffer") -> None:
         """Update the current frame (thread-safe)."""
+        # This runs on every kernel render tick, but the display rarely changes that often
+        current = self._frame
+        if (
+            current is not None
+            and current.data.shape == frame.data.shape
+            and np.array_equal(current.data, frame.data)
+        ):
+            return  # Unchanged - keep the version so streams can skip re-encoding
+
+        # Publish a fresh read-only snapshot, so readers can share it without copying.
+        # Compare and copy outside the lock; it only covers the swap itself.
+        snapshot = frame.copy()
+        snapshot.data.flags.writeable = False
+
         with self._frame_lock:
-            self._frame = frame.copy()
+            self._frame = snapshot
+            self._frame_version += 1
+            waiters = self._frame_waiters
 
-    def get_frame(self) -> Optional["FrameBuffer"]:
-        """Get a copy of the current frame (thread-safe)."""
+        _wake(waiters)
+
+    @property
+    def frame_version(self) -> int:
+        """Counter bumped whenever the current frame's pixels change."""
+        return self._frame_version
+
+    def subscribe_frames(self) -> asyncio.Event:
+        """Get an event (for the running loop) that is set whenever the frame changes."""
+        event = asyncio.Event()
         with self._frame_lock:
-            return self._frame.copy() if self._frame else None
+            self._frame_waiters = (*self._frame_waiters, (asyncio.get_running_loop(), event))
+        return event
+
+    def unsubscribe_frames(self, event: asyncio.Event) -> None:
+        """Stop waking an event returned by subscribe_frames."""
+        with self._frame_lock:
+            self._frame_waiters = tuple(w for w in self._frame_waiters if w[1] is not event)
+
+    def get_frame(self) -> Optional["FrameBuffer"]:
+        """Get the current frame (thread-safe). Read-only - copy it before drawing on it."""
+        return self._frame
 
     def add_log(self, record: Dict) -> None:
-        """Add a log record (thread-safe)."""
+        """Add a log record (thread-safe, never blocks)."""
+        # Serialize once here rather than once per log stream client
+        incoming = self._log_incoming
+        if orjson:
+            wire = orjson.dumps(record, default=str).decode()
+        else:
+            wire = json.dumps(record, default=str)
+        incoming.put((record, wire))
+
+        # With no reader draining the handoff queue, keep it from growing unbounded;
+        # if another thread is already draining, leave it to that one
+        if incoming.qsize() >= _LOG_HISTORY and self._log_lock.acquire(blocking=False):
+            try:
+                self._drain_logs()
+            finally:
+                self._log_lock.release()
+
+        _wake(self._log_waiters)
+
+    def _drain_logs(self) -> None:
+        """Move handed-off logs into the ring. Call with _log_lock held."""
+        incoming = self._log_incoming
+        ring = self._log_ring
+        total = self._log_total
+        try:
+            while True:
+                ring[total & _LOG_MASK] = incoming.get_nowait()
+                # Store the record before publishing it by bumping the count
+                total += 1
+                self._log_total = total
+        except queue.Empty:
+            pass
+
+    def _sync_logs(self) -> None:
+        """Bring the ring up to date with every log added so far."""
+        if not self._log_incoming.empty():
+            with self._log_lock:
+                self._drain_logs()
+
+    def subscribe_logs(self) -> asyncio.Event:
+        """Get an event (for the running loop) that is set whenever a log is added."""
+        event = asyncio.Event()
         with self._log_lock:
-            self._logs.append(record)
+            self._log_waiters = (*self._log_waiters, (asyncio.get_running_loop(), event))
+        return event
 
-    def get_logs(self, since_index: int = 0) -> List[Dict]:
-        """Get logs since a given index (thread-safe)."""
+    def unsubscribe_logs(self, event: asyncio.Event) -> None:
+        """Stop waking an event returned by subscribe_logs."""
         with self._log_lock:
-            logs = list(self._logs)
-        return logs[since_index:]
+            self._log_waiters = tuple(w for w in self._log_waiters if w[1] is not event)
+
+    def _read_log_entries(self, cursor: int) -> Tuple[List[Tuple[Dict, str]], int]:
+        """
+        Get the ring entries added since cursor and the cursor to pass next time.
+
+        Lock-free unless there are handed-off logs to move into the ring first.
+        Logs that already fell out of the history are skipped.
+        """
+        self._sync_logs()
+        ring = self._log_ring
+        end = self._log_total
+        start = max(cursor, end - _LOG_HISTORY)
+        entries = [ring[i & _LOG_MASK] for i in range(start, end)]
+
+        # Drop any slots a writer lapped while we were copying
+        overwritten = self._log_total - _LOG_HISTORY - start
+        if overwritten > 0:
+            del entries[:overwritten]
+        return entries, end
+
+    def read_logs(self, cursor: int = 0) -> Tuple[List[Dict], int]:
+        """Get the logs added since cursor and the cursor to pass next time."""
+        entries, cursor = self._read_log_entries(cursor)
+        return [record for record, _ in entries], cursor
+
+    def read_logs_json(self, cursor: int = 0) -> Tuple[Optional[str], int]:
+        """
+        Get the logs added since cursor as a JSON array (None if there are none)
+        and the cursor to pass next time, reusing each log's cached JSON.
+        """
+        entries, cursor = self._read_log_entries(cursor)
+        if not entries:
+            return None, cursor
+        return "[" + ",".join([wire for _, wire in entries]) + "]", cursor
+
+    def get_logs(self, since_index: int = 0) -> List[Dict]:
+        """Get logs since a given log count (thread-safe)."""
+        return self.read_logs(since_index)[0]
 
     def get_log_count(self) -> int:
-        """Get the current log count."""
-        with self._log_lock:
-            return len(self._logs)
+        """Get the number of logs added so far (a cursor for get_logs)."""
+        self._sync_logs()
+        return self._log_total
 
     def register_app(self, app_info: AppInfo) -> None:
         """Register an app's info (thread-safe)."""
         with self._apps_lock:
-            self._apps[app_info.app_id] = app_info
+            self._apps = {**self._apps, app_info.app_id: app_info}
 
     def set_current_app(self, app_id: Optional[str]) -> None:
         """Set the currently active app (thread-safe)."""
         with self._apps_lock:
             self._current_app = app_id
-            for aid, info in self._apps.items():
-                info.is_active = aid == app_id
+            # New infos rather than flipping is_active in place under readers
+            self._apps = {
+                aid: (
+                    info
+                    if info.is_active == (aid == app_id)
+                    else replace(info, is_active=aid == app_id)
+                )
+                for aid, info in self._apps.items()
+            }
 
     def get_apps(self) -> List[AppInfo]:
-        """Get all registered apps (thread-safe)."""
-        with self._apps_lock:
-            return list(self._apps.values())
+        """Get all registered apps (thread-safe). Treat them as read-only."""
+        return list(self._apps.values())
 
     def get_current_app_id(self) -> Optional[str]:
         """Get the current app ID."""
-        with self._apps_lock:
-            return self._current_app
+        return self._current_app
+
+
+def _wake(waiters: Tuple[Tuple[asyncio.AbstractEventLoop, asyncio.Event], ...]) -> None:
+    """Set stream events from any thread, through each one's event loop."""
+    for loop, event in waiters:
+        if not event.is_set():
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass  # Loop already closed (shutting down)
 
 
 # Global shared state
@@ -135,22 +297,32 @@ class WebLogHandler(logging.Handler):
     def __init__(self, shared_state: SharedState):
         super().__init__()
         self.shared_state = shared_state
-        self.setFormatter(
-            logging.Formatter(
-                "%(asctime)s : %(levelname)-8s : (%(name)s) %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
-            )
-        )
+        # Only renders tracebacks; emit() lays out the line itself
+        self.setFormatter(logging.Formatter())
 
     def emit(self, record: logging.LogRecord) -> None:
         try:
+            # Build the line straight from the record, in the console's layout, rather
+            # than through Formatter's %-style rendering on every logging call
+            asctime = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(record.created))
+            message = record.getMessage()
+            formatted = f"{asctime} : {record.levelname:<8} : ({record.name}) {message}"
+
+            # Keep tracebacks and stacks, as Formatter.format would
+            if record.exc_info and not record.exc_text:
+                record.exc_text = self.formatter.formatException(record.exc_info)
+            if record.exc_text:
+                formatted = f"{formatted}\n{record.exc_text}"
+            if record.stack_info:
+                formatted = f"{formatted}\n{self.formatter.formatStack(record.stack_info)}"
+
             log_entry = {
-                "timestamp": time.time(),
-                "time": self.format(record).split(" : ")[0],
+                "timestamp": record.created,
+                "time": asctime,
                 "level": record.levelname,
                 "logger": record.name,
-                "message": record.getMessage(),
-                "formatted": self.format(record),
+                "message": message,
+                "formatted": formatted,
             }
             self.shared_state.add_log(log_entry)
         except Exception:
@@ -229,49 +401,68 @@ def create_app(shared_state: Optional[SharedState] = None) -> FastAPI:
     @app.get("/stream")
     async def stream_display():
         """MJPEG stream of the current display."""
-        from PIL import Image
+        # One encode buffer per stream, rewound for each frame
+        buffer = io.BytesIO()
 
-        async def generate():
-            frame_interval = 1.0 / 30  # 30 FPS target
+        def encode(img: Image.Image) -> bytes:
+            """Encode as an MJPEG part."""
+            buffer.seek(0)
+            buffer.truncate()
+            # Native resolution - the page upscales it with pixelated rendering. Full-res
+            # chroma (4:4:4) so colors don't bleed across the few, large pixels; flat
+            # pixel art holds up at quality 75, with no extra optimize/progressive passes.
+            img.save(
+                buffer,
+                format="JPEG",
+                quality=75,
+                subsampling=0,
+                optimize=False,
+                progressive=False,
+            )
 
-            while True:
-                # Get current frame
-                frame = shared_state.get_frame()
-
-                if frame:
-                    img = frame.to_image()
-                else:
-                    # Create a dark placeholder
-                    img = Image.new(
-                        "RGB",
-                        (shared_state.display_width, shared_state.display_height),
-                        (5, 5, 5),
-                    )
-
-                # Scale up for visibility
-                scaled = img.resize(
-                    (
-                        shared_state.display_width * shared_state.scale_factor,
-                        shared_state.display_height * shared_state.scale_factor,
-                    ),
-                    Image.Resampling.NEAREST,
-                )
+            # Assemble the part straight from the buffer, without a getvalue() copy
+            with buffer.getbuffer() as jpeg:
+                return b"".join((_MJPEG_PART_HEADER, b"%d\r\n\r\n" % len(jpeg), jpeg, b"\r\n"))
 
-                # Encode as JPEG
-                buffer = io.BytesIO()
-                scaled.save(buffer, format="JPEG", quality=85)
-                jpeg_bytes = buffer.getvalue()
-
-                # Yield MJPEG frame
-                yield (
-                    b"--frame\r\n"
-                    b"Content-Type: image/jpeg\r\n"
-                    b"Content-Length: " + str(len(jpeg_bytes)).encode() + b"\r\n"
-                    b"\r\n" + jpeg_bytes + b"\r\n"
-                )
+        # Dark placeholder until the first frame arrives, encoded once per stream
+        placeholder = encode(
+            Image.new("RGB", (shared_state.display_width, shared_state.display_height), (5, 5, 5))
+        )
 
-                # Rate limit (non-blocking)
-                await asyncio.sleep(frame_interval)
+        async def generate():
+            frame_interval = 1.0 / 30  # 30 FPS cap
+            part, part_version = placeholder, 0
+            new_frame = shared_state.subscribe_frames()
+
+            try:
+                while True:
+                    # Clear before reading, so a frame set meanwhile wakes us again
+                    new_frame.clear()
+
+                    # Only re-encode when the display actually changed
+                    version = shared_state.frame_version
+                    if version != part_version:
+                        frame = shared_state.get_frame()
+                        part = encode(frame.to_image()) if frame else placeholder
+                        part_version = version
+
+                    # Yield MJPEG frame
+                    yield part
+                    sent = time.monotonic()
+
+                    # Push on the next change; resend the current frame every second
+                    # meanwhile so idle connections stay alive
+                    try:
+                        await asyncio.wait_for(new_frame.wait(), timeout=1.0)
+                    except asyncio.TimeoutError:
+                        pass
+
+                    # Rate limit (non-blocking)
+                    remaining = frame_interval - (time.monotonic() - sent)
+                    if remaining > 0:
+                        await asyncio.sleep(remaining)
+            finally:
+                shared_state.unsubscribe_frames(new_frame)
 
         return StreamingResponse(
             generate(),
@@ -300,32 +491,39 @@ def create_app(shared_state: Optional[SharedState] = None) -> FastAPI:
         """SSE endpoint for real-time log streaming."""
 
         async def event_generator():
-            last_index = 0
-
-            while True:
-                # Check if client disconnected
-                if await request.is_disconnected():
-                    break
-
-                # Get new logs since last check
-                logs = shared_state.get_logs(last_index)
-                if logs:
-                    for log_entry in logs:
+            cursor = 0
+            new_logs = shared_state.subscribe_logs()
+
+            try:
+                while True:
+                    # Check if client disconnected
+                    if await request.is_disconnected():
+                        break
+
+                    # Clear before reading, so a log added meanwhile wakes us again
+                    new_logs.clear()
+
+                    # Get new logs since last check (and where to continue from, atomically)
+                    # and send them as one event carrying a JSON array
+                    logs_json, cursor = shared_state.read_logs_json(cursor)
+                    if logs_json:
                         yield {
                             "event": "message",
-                            "data": json.dumps(log_entry),
+                            "data": logs_json,
                         }
-                    last_index = shared_state.get_log_count()
 
-                await asyncio.sleep(0.1)  # Poll every 100ms
+                    # Sleep until the next log instead of polling
+                    await new_logs.wait()
+            finally:
+                shared_state.unsubscribe_logs(new_logs)
 
-        return EventSourceResponse(event_generator())
+        # Keep-alive pings come from the response's own ticker task, so the generator
+        # just sleeps until the next log - no wait timeouts on the steady-state path
+        return EventSourceResponse(event_generator(), ping=_SSE_PING_INTERVAL)
 
     @app.get("/api/frame")
     async def get_frame():
         """Get current frame as base64 PNG."""
-        from PIL import Image
-
         frame = shared_state.get_frame()
         if frame:
             img = frame.to_image()
@@ -1 +1,9 @@
 """Pytest configuration for matrix-os tests."""
+
+import sys
+from pathlib import Path
+
+# Import matrix_os from the source tree when it isn't installed
+SRC_DIR = str(Path(__file__).parent.parent / "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
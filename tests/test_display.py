@@ -0,0 +1,50 @@
+"""Tests for framebuffer recycling."""
+
+from matrix_os.core.display import FrameBuffer, FrameBufferPool
+
+
+class TestFrameBufferPool:
+    """Test suite for FrameBufferPool."""
+
+    def test_acquire_release_round_trip(self):
+        """A released buffer is handed out again instead of a new one."""
+        pool = FrameBufferPool(64, 32, size=2)
+        fb = pool.acquire()
+        assert (fb.width, fb.height) == (64, 32)
+
+        pool.release(fb)
+        assert pool.acquire() is fb
+
+    def test_release_clears(self):
+        """Buffers come back from the pool cleared."""
+        pool = FrameBufferPool(64, 32, size=1)
+        fb = pool.acquire()
+        fb.clear((255, 128, 0))
+
+        pool.release(fb)
+        assert not pool.acquire().data.any()
+
+    def test_wrong_size_rejected(self):
+        """A buffer of another size is not taken into the pool."""
+        pool = FrameBufferPool(64, 32, size=1)
+        pool.acquire()  # Empty the pool
+
+        other = FrameBuffer(32, 16)
+        pool.release(other)
+        assert pool.acquire() is not other
+
+    def test_bounded(self):
+        """The pool keeps at most size buffers, however many are released."""
+        pool = FrameBufferPool(64, 32, size=2)
+        extra = [FrameBuffer(64, 32) for _ in range(5)]
+        for fb in extra:
+            pool.release(fb)
+
+        kept = [pool.acquire() for _ in range(2)]
+        # The two preallocated buffers filled the pool, so none of the extra ones were kept
+        assert not {id(fb) for fb in kept} & {id(fb) for fb in extra}
+        assert len(pool._free) == 0
+
+        for fb in [*kept, *extra]:
+            pool.release(fb)
+        assert len(pool._free) == 2
@@ -0,0 +1,54 @@
+"""Tests for glyph atlases against PIL's own text rendering."""
+
+import string
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from matrix_os.apps.fonts import get_glyph_atlas, load_bdf_font
+
+FONTS_DIR = Path(__file__).parent.parent / "fonts"
+BDF_FONTS = sorted(FONTS_DIR.glob("*.bdf"))
+
+# What the apps draw (clock and weather text), plus all of printable ASCII
+TEXTS = ["12:34", "09:05 PM", "72°F", "-3°C", "Partly Cloudy", string.printable.strip()]
+
+
+@pytest.mark.parametrize("font_path", BDF_FONTS, ids=lambda path: path.name)
+class TestGlyphAtlas:
+    """Test suite for GlyphAtlas, for every bundled BDF font."""
+
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_matches_pil(self, font_path, text):
+        """Drawn pixels and measured size match ImageDraw.text and textbbox."""
+        font = load_bdf_font(str(font_path))
+        atlas = get_glyph_atlas(str(font_path))
+        color = (255, 128, 0)
+
+        image = Image.new("RGB", (len(text) * 32 + 8, 48))
+        draw = ImageDraw.Draw(image)
+        draw.text((2, 3), text, fill=color, font=font)
+        _, _, right, bottom = draw.textbbox((0, 0), text, font=font)
+
+        drawn = np.zeros((image.height, image.width, 3), dtype=np.uint8)
+        atlas.draw(drawn, (2, 3), text, color)
+
+        assert np.array_equal(drawn, np.asarray(image))
+        assert (atlas.text_width(text), atlas.text_height(text)) == (right, bottom)
+
+    def test_clips_at_edges(self, font_path):
+        """Text running off every edge draws the same visible pixels as PIL."""
+        font = load_bdf_font(str(font_path))
+        atlas = get_glyph_atlas(str(font_path))
+        text = "Partly Cloudy 72°F"
+
+        for xy in [(-5, -3), (40, 20), (-100, 0)]:
+            image = Image.new("RGB", (64, 32))
+            ImageDraw.Draw(image).text(xy, text, fill=(0, 255, 0), font=font)
+
+            drawn = np.zeros((32, 64, 3), dtype=np.uint8)
+            atlas.draw(drawn, xy, text, (0, 255, 0))
+
+            assert np.array_equal(drawn, np.asarray(image)), xy
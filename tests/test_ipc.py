@@ -0,0 +1,86 @@
+"""Tests for the shared-memory frame transport."""
+
+import pickle
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from matrix_os.core import Kernel
+from matrix_os.core.ipc import _WRITING
+
+APP_ID = "app_1"
+
+
+@pytest.fixture
+def kernel():
+    """A kernel with one app's frame slot, without starting any processes."""
+    kernel = Kernel()
+    kernel.message_bus.create_app_channel(APP_ID, kernel.display.width, kernel.display.height)
+    kernel.scheduler.add_app(APP_ID)
+    kernel._app_instances[APP_ID] = SimpleNamespace(fb=kernel.create_framebuffer())
+    yield kernel
+    kernel.message_bus.shutdown()
+    kernel.message_bus.close()
+
+
+def publish(kernel: Kernel, value: int, slot=None) -> None:
+    """Write a solid frame into the app's slot, as the app process would."""
+    pixels = np.full((kernel.display.height, kernel.display.width, 3), value, dtype=np.uint8)
+    (slot or kernel.message_bus.get_frame_slots()[APP_ID]).write(pixels)
+
+
+def poll(kernel: Kernel):
+    """Run the frame half of a render tick and return the frame it would display."""
+    kernel._poll_shared_frames()
+    kernel.scheduler.submit_frames(kernel._pending_frames)
+    kernel._pending_frames.clear()
+    return kernel.scheduler.tick()
+
+
+class TestFrameSlot:
+    """Test suite for FrameSlot reads through the kernel."""
+
+    def test_new_frame_is_displayed(self, kernel):
+        """A published frame reaches the scheduler on the next poll."""
+        publish(kernel, 10)
+        assert (poll(kernel).data == 10).all()
+
+    def test_torn_frame_is_not_displayed(self, kernel, monkeypatch):
+        """A frame the app overwrites mid-copy is dropped, leaving the last good frame shown."""
+        publish(kernel, 10)
+        shown = poll(kernel)
+        publish(kernel, 20)
+
+        slot = kernel.message_bus.get_frame_slots()[APP_ID]
+        copyto = np.copyto
+
+        def lapped_copyto(dst, src, *args, **kwargs):
+            # The app laps the kernel: it starts writing two generations on, into the
+            # very buffer being copied out
+            if any(src is buffer for buffer in slot._buffers):
+                slot._header[_WRITING] += 2
+                src[...] = 99
+            copyto(dst, src, *args, **kwargs)
+
+        monkeypatch.setattr(np, "copyto", lapped_copyto)
+        frame = poll(kernel)
+        monkeypatch.undo()
+
+        assert frame is shown
+        assert (frame.data == 10).all()
+
+    def test_restarted_app_first_frame_is_displayed(self, kernel):
+        """A new app process attaching to the slot continues the published generations."""
+        slot = kernel.message_bus.get_frame_slots()[APP_ID]
+
+        # Each app process gets its own copy of the slot, attached by name
+        first = pickle.loads(pickle.dumps(slot))
+        publish(kernel, 10, first)
+        assert (poll(kernel).data == 10).all()
+        first.close()
+
+        restarted = pickle.loads(pickle.dumps(slot))
+        publish(kernel, 20, restarted)
+        assert (poll(kernel).data == 20).all()
+        restarted.close()
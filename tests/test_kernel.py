@@ -0,0 +1,86 @@
+"""Tests for the kernel's frame handoff."""
+
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from matrix_os.core import Kernel
+from matrix_os.core.display import FrameBuffer
+from matrix_os.core.ipc import Message, MessageType
+
+APP_ID = "app_1"
+
+
+@pytest.fixture
+def kernel():
+    """A kernel with one registered app, without starting any processes."""
+    kernel = Kernel()
+    kernel.scheduler.add_app(APP_ID)
+    kernel._app_instances[APP_ID] = SimpleNamespace(fb=kernel.create_framebuffer())
+    yield kernel
+    kernel.message_bus.shutdown()
+    kernel.message_bus.close()
+
+
+class TestFrameReady:
+    """Test suite for frames submitted as FRAME_READY messages."""
+
+    def test_frame_is_copied(self, kernel):
+        """The displayed frame is the kernel's copy, unaffected by the app drawing on."""
+        fb = FrameBuffer(kernel.display.width, kernel.display.height)
+        fb.clear((10, 20, 30))
+        kernel._on_frame_ready(Message(MessageType.FRAME_READY, source=APP_ID, payload=fb))
+        kernel.scheduler.submit_frames(kernel._pending_frames)
+        kernel._pending_frames.clear()
+
+        fb.clear((99, 99, 99))
+        frame = kernel.scheduler.tick()
+
+        assert frame is not fb
+        assert (frame.data == (10, 20, 30)).all()
+
+
+class TestUnregister:
+    """Test suite for releasing an unregistered app's buffers."""
+
+    @pytest.fixture
+    def running(self, kernel):
+        """The kernel with an app publishing through shared memory and a live render thread."""
+        kernel.message_bus.create_app_channel(APP_ID, kernel.display.width, kernel.display.height)
+
+        # Stands in for the render thread; the test runs its tick steps itself
+        stop = threading.Event()
+        kernel._render_thread = threading.Thread(target=stop.wait)
+        kernel._render_thread.start()
+        yield kernel
+        stop.set()
+        kernel._render_thread.join()
+
+    def test_release_waits_for_render_thread(self, running):
+        """A frame mid-tick when its app is unregistered isn't reused until the next tick."""
+        kernel = running
+        pixels = np.full((kernel.display.height, kernel.display.width, 3), 10, dtype=np.uint8)
+        kernel.message_bus.get_frame_slots()[APP_ID].write(pixels)
+        kernel._poll_shared_frames()
+        ((_, frame),) = kernel._pending_frames
+
+        # Unregistered between polling and submitting: the tick goes on with the frame
+        kernel.unregister_app(APP_ID)
+        kernel.scheduler.submit_frames(kernel._pending_frames)
+        kernel._pending_frames.clear()
+        assert (frame.data == 10).all()
+        assert all(fb is not frame for fb in kernel.display.pool._free)
+
+        # The next tick releases it and forgets the app
+        kernel._release_removed_apps()
+        assert APP_ID not in kernel._app_frames
+        assert APP_ID not in kernel.scheduler._frames
+        assert any(fb is frame for fb in kernel.display.pool._free)
+
+    def test_released_at_once_when_not_running(self, kernel):
+        """Without a render thread, unregistering frees the app's buffers right away."""
+        app_fb = kernel._app_instances[APP_ID].fb
+        kernel.unregister_app(APP_ID)
+        assert any(fb is app_fb for fb in kernel.display.pool._free)
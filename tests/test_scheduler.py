@@ -0,0 +1,118 @@
+"""Tests for app rotation in the scheduler."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from matrix_os.core import scheduler as scheduler_module
+from matrix_os.core.config import SchedulerConfig
+from matrix_os.core.scheduler import AppScheduler
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A manual monotonic clock for the scheduler, as a one-item list of seconds."""
+    now = [0.0]
+    monkeypatch.setattr(scheduler_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def scheduler(clock):
+    """A scheduler rotating a, b, c and d for 10 seconds each."""
+    scheduler = AppScheduler(SchedulerConfig())
+    for app_id in "abcd":
+        scheduler.add_app(app_id, duration=10)
+    return scheduler
+
+
+def rotation(scheduler: AppScheduler, clock, count: int) -> str:
+    """Let count app durations pass and return the apps shown, starting with the current one."""
+    shown = [scheduler.get_current_app()]
+    for _ in range(count):
+        clock[0] += 10
+        scheduler.tick()
+        shown.append(scheduler.get_current_app())
+    return "".join(shown)
+
+
+class TestRotation:
+    """Test suite for the rotation order."""
+
+    def test_round_robin(self, scheduler, clock):
+        """Apps rotate in the order they were added, after their duration."""
+        assert rotation(scheduler, clock, 5) == "abcdab"
+
+    def test_not_due(self, scheduler, clock):
+        """The current app stays until its duration is up."""
+        clock[0] += 9.9
+        scheduler.tick()
+        assert scheduler.get_current_app() == "a"
+
+    def test_add_while_another_is_current(self, scheduler, clock):
+        """An app added mid-rotation joins at the end without disturbing the order."""
+        rotation(scheduler, clock, 1)  # b is current
+        scheduler.add_app("e", duration=10)
+        assert rotation(scheduler, clock, 5) == "bcdeab"
+
+    def test_remove_while_another_is_current(self, scheduler, clock):
+        """Removing apps other than the current one keeps the order of the rest."""
+        rotation(scheduler, clock, 1)  # b is current
+        scheduler.remove_app("a")
+        scheduler.remove_app("c")
+        assert rotation(scheduler, clock, 3) == "bdbd"
+
+    def test_remove_current(self, scheduler, clock):
+        """Removing the current app moves straight on to the one after it."""
+        changes = []
+        scheduler.on_app_change(lambda old, new: changes.append((old, new)))
+        rotation(scheduler, clock, 1)  # b is current
+        clock[0] += 3
+
+        scheduler.remove_app("b")
+        assert scheduler.get_current_app() == "c"
+        assert changes[-1] == ("b", "c")
+
+        # c gets its full duration from when it took over
+        clock[0] += 9.9
+        scheduler.tick()
+        assert scheduler.get_current_app() == "c"
+        assert rotation(scheduler, clock, 3) == "cdac"
+
+    def test_remove_current_last(self, scheduler, clock):
+        """Removing the current app at the end of the rotation wraps to the start."""
+        rotation(scheduler, clock, 3)  # d is current
+        scheduler.remove_app("d")
+        assert scheduler.get_current_app() == "a"
+
+    def test_remove_only_app(self, clock):
+        """Removing the only app leaves nothing current."""
+        scheduler = AppScheduler(SchedulerConfig())
+        scheduler.add_app("a", duration=10)
+        scheduler.remove_app("a")
+        assert scheduler.get_current_app() is None
+        assert scheduler.tick() is None
+
+
+class TestPersistent:
+    """Test suite for persistent apps."""
+
+    def test_never_rotated_out(self, scheduler, clock):
+        """A persistent app stays active whichever app is displayed."""
+        scheduler.add_app("p", duration=10, is_persistent=True)
+        for _ in range(10):
+            assert "p" in scheduler.get_active_apps()
+            rotation(scheduler, clock, 1)
+
+    def test_active_apps_without_duplicates(self, scheduler, clock):
+        """A persistent app that is also displayed is listed once."""
+        scheduler.add_app("p", duration=10, is_persistent=True)
+        rotation(scheduler, clock, 4)  # p is current
+        assert scheduler.get_active_apps() == ["p"]
+
+    def test_removed_persistent_app(self, scheduler, clock):
+        """Removing a persistent app drops it from the active apps."""
+        scheduler.add_app("p", duration=10, is_persistent=True)
+        scheduler.remove_app("p")
+        assert "p" not in scheduler.get_active_apps()
+        assert rotation(scheduler, clock, 4) == "abcda"
@@ -0,0 +1,61 @@
+"""Tests for the web interface's log history."""
+
+import json
+
+from matrix_os.web.app import _LOG_HISTORY, SharedState
+
+
+def add_logs(state: SharedState, start: int, count: int) -> None:
+    """Add logs numbered start to start + count - 1."""
+    for n in range(start, start + count):
+        state.add_log({"n": n, "message": f"log {n}"})
+
+
+class TestLogRing:
+    """Test suite for SharedState's log ring and cursor reads."""
+
+    def test_read_since_cursor(self):
+        """A cursor picks up exactly the logs added after it."""
+        state = SharedState()
+        add_logs(state, 0, 5)
+        logs, cursor = state.read_logs()
+        assert [log["n"] for log in logs] == [0, 1, 2, 3, 4]
+
+        add_logs(state, 5, 2)
+        logs, cursor = state.read_logs(cursor)
+        assert [log["n"] for log in logs] == [5, 6]
+        assert state.read_logs(cursor) == ([], cursor)
+
+    def test_stale_cursor_gets_retained_tail(self):
+        """A reader lapped by the ring gets the retained logs, once each, in order."""
+        state = SharedState()
+        add_logs(state, 0, 10)
+        _, cursor = state.read_logs()
+
+        # Wrap the ring more than once past the reader's cursor
+        total = 10 + 2 * _LOG_HISTORY + 7
+        add_logs(state, 10, total - 10)
+
+        logs, cursor = state.read_logs(cursor)
+        assert [log["n"] for log in logs] == list(range(total - _LOG_HISTORY, total))
+        assert cursor == total == state.get_log_count()
+
+        add_logs(state, total, 1)
+        logs, _ = state.read_logs(cursor)
+        assert [log["n"] for log in logs] == [total]
+
+    def test_stale_cursor_json(self):
+        """The cached-JSON read returns the same retained tail as one JSON array."""
+        state = SharedState()
+        add_logs(state, 0, _LOG_HISTORY + 100)
+
+        logs_json, cursor = state.read_logs_json(0)
+        assert json.loads(logs_json) == state.read_logs(0)[0]
+        assert [log["n"] for log in json.loads(logs_json)] == list(range(100, _LOG_HISTORY + 100))
+        assert state.read_logs_json(cursor) == (None, cursor)
+
+    def test_unread_handoff_is_bounded(self):
+        """With no reader, logs waiting to enter the ring stay within the history size."""
+        state = SharedState()
+        add_logs(state, 0, 5 * _LOG_HISTORY)
+        assert state._log_incoming.qsize() < _LOG_HISTORY